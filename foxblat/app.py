@@ -326,7 +326,7 @@ class MyApp(Adw.Application):
 
         # Start plugin manager and load plugin panels
         # Subscribe to dynamic plugin panel events (for devices connected after startup)
-        self._plugin_manager.subscribe("plugin-panel-available", self._on_plugin_panel_available)
+        self._plugin_manager.subscribe("plugin-panels-updated", self._on_plugin_panels_updated)
         self._plugin_manager.start()
         self._load_plugin_panels()
 
@@ -369,10 +369,17 @@ class MyApp(Adw.Application):
             self._add_plugin_panel(title, panel)
 
 
-    def _on_plugin_panel_available(self, plugin_name: str, panel) -> None:
-        """Called when a plugin's matching device is connected (from background thread)."""
-        title = panel.title
-        GLib.idle_add(self._add_plugin_panel, title, panel)
+    def _on_plugin_panels_updated(self, panels: dict) -> None:
+        """Called when matching plugin devices are connected (from background thread)."""
+        GLib.idle_add(self._create_plugin_panels, list(panels.values()))
+
+
+    def _create_plugin_panels(self, getters: list) -> None:
+        """Build plugin panels on the main thread and add them to the UI."""
+        for get_panel in getters:
+            panel = get_panel()
+            if panel:
+                self._add_plugin_panel(panel.title, panel)
 
 
     def _add_plugin_panel(self, title: str, panel) -> None:
@@ -50,7 +50,7 @@ class PresetSettings(SettingsPanel):
 
         # Subscribe to plugin panel availability for dynamic switch addition
         if self._plugin_manager:
-            self._plugin_manager.subscribe("plugin-panel-available", self._on_plugin_available)
+            self._plugin_manager.subscribe("plugin-panels-updated", self._on_plugins_available)
 
         self._default_preset_loaded = Event()
         if self._settings.read_setting("default-preset-on-startup"):
@@ -254,10 +254,16 @@ class PresetSettings(SettingsPanel):
         panel.subscribe("active", row.set_present)
         self._plugin_includes[device_name] = row.get_value
 
-    def _on_plugin_available(self, plugin_name: str, panel) -> None:
-        """Called when a plugin's matching device is connected (from background thread)."""
-        device_name = panel.preset_device_name
-        GLib.idle_add(self._add_single_plugin_switch, device_name, panel)
+    def _on_plugins_available(self, panels: dict) -> None:
+        """Called when matching plugin devices are connected (from background thread)."""
+        GLib.idle_add(self._add_available_plugin_switches, list(panels.values()))
+
+    def _add_available_plugin_switches(self, getters: list) -> None:
+        """Add include switches once the plugin panels exist (main thread)."""
+        for get_panel in getters:
+            panel = get_panel()
+            if panel:
+                self._add_single_plugin_switch(panel.preset_device_name, panel)
 
 
     def _on_car_name_for_clone(self, car_name: str) -> None:
@@ -2,6 +2,15 @@
 
 import json
 
+# Game gain percentages (0-100) pre-scaled to the 0-255 range used by the base
+_GAIN_LUT = tuple(min(round(2.55 * i), 255) for i in range(101))
+
+
+def _scale_gain(value) -> int:
+    if type(value) is int and 0 <= value <= 100:
+        return _GAIN_LUT[value]
+    return min(round(2.55 * value), 255)
+
 
 class PithouseConverter:
     """Converts Moza Pithouse presets to boxflat/foxblat format."""
@@ -50,6 +59,14 @@ class PithouseConverter:
             "main": self._convert_main(device_params),
         }
 
+    def _validate_and_convert(self, pithouse_data: dict) -> tuple[dict | None, str]:
+        """Validate a Pithouse preset and convert it if valid."""
+        is_valid, error = self.validate(pithouse_data)
+        if not is_valid:
+            return None, error
+
+        return self.convert(pithouse_data), ""
+
     def _convert_base(self, device_params: dict) -> dict:
         """Convert deviceParams to base settings."""
         base = {
@@ -90,10 +107,10 @@ class PithouseConverter:
     def _convert_main(self, device_params: dict) -> dict:
         """Convert deviceParams to main settings."""
         return {
-            "set-damper-gain": min(round(2.55 * device_params.get("setGameDampingValue", 0)), 255),
-            "set-friction-gain": min(round(2.55 * device_params.get("setGameFrictionValue", 0)), 255),
-            "set-inertia-gain": min(round(2.55 * device_params.get("setGameInertiaValue", 0)), 255),
-            "set-spring-gain": min(round(2.55 * device_params.get("setGameSpringValue", 0)), 255),
+            "set-damper-gain": _scale_gain(device_params.get("setGameDampingValue", 0)),
+            "set-friction-gain": _scale_gain(device_params.get("setGameFrictionValue", 0)),
+            "set-inertia-gain": _scale_gain(device_params.get("setGameInertiaValue", 0)),
+            "set-spring-gain": _scale_gain(device_params.get("setGameSpringValue", 0)),
             "set-interpolation": device_params.get("constForceExtraMode", 0),
         }
 
@@ -143,11 +160,8 @@ class PithouseConverter:
         except OSError as e:
             return None, "", f"Failed to read file: {e}"
 
-        is_valid, error = self.validate(pithouse_data)
-        if not is_valid:
+        converted, error = self._validate_and_convert(pithouse_data)
+        if converted is None:
             return None, "", error
 
-        preset_name = self.get_preset_name(pithouse_data)
-        converted = self.convert(pithouse_data)
-
-        return converted, preset_name, ""
+        return converted, self.get_preset_name(pithouse_data), ""
@@ -1,5 +1,6 @@
 # Copyright (c) 2026, R. Orth (giantorth)
 
+import sys
 from abc import abstractmethod
 from foxblat.panels.settings_panel import SettingsPanel
 from typing import TYPE_CHECKING
@@ -13,6 +14,8 @@ class PluginContext:
     """
     Context object passed to plugins providing access to foxblat infrastructure.
     """
+    __slots__ = ("hid_handler", "settings_handler", "plugin_path", "config_path")
+
     def __init__(self, hid_handler: 'HidHandler', settings_handler: 'SettingsHandler',
                  plugin_path: str, config_path: str):
         self.hid_handler = hid_handler
@@ -25,6 +28,8 @@ class PluginDeviceInfo:
     """
     Information about a connected device that matched the plugin.
     """
+    __slots__ = ("name", "vendor_id", "product_id", "path")
+
     def __init__(self, name: str, vendor_id: int, product_id: int, path: str):
         self.name = name
         self.vendor_id = vendor_id
@@ -94,12 +99,11 @@ class PluginPanel(SettingsPanel):
 
     def on_device_connected(self, device: PluginDeviceInfo) -> None:
         """Called when a matching device is connected. Override in subclass."""
-        self._connected_devices[device.path] = device
+        self._connected_devices[sys.intern(device.path)] = device
 
     def on_device_disconnected(self, device: PluginDeviceInfo) -> None:
         """Called when a matching device is disconnected. Override in subclass."""
-        if device.path in self._connected_devices:
-            del self._connected_devices[device.path]
+        self._connected_devices.pop(sys.intern(device.path), None)
 
     def get_preset_settings(self) -> dict:
         """
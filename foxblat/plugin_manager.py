@@ -4,6 +4,9 @@ import json
 import re
 import importlib.util
 import evdev
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from threading import Thread, Event, Lock
 from time import sleep
 from typing import Optional, Callable
@@ -11,6 +14,18 @@ from typing import Optional, Callable
 from foxblat.subscription import EventDispatcher
 from foxblat.plugin_base import PluginPanel, PluginContext, PluginDeviceInfo
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=512)
+def _compile_name_re(pattern: str) -> re.Pattern:
+    """Compile a case-insensitive name pattern, shared between plugins using the same one."""
+    return re.compile(pattern, re.IGNORECASE)
+
 
 class PluginMatcher:
     """Device matching rules for a plugin."""
@@ -18,41 +33,110 @@ class PluginMatcher:
         self.plugin_name = plugin_name
         self.devices = metadata.get("devices", [])
 
-    def matches(self, device: evdev.InputDevice) -> bool:
-        """Check if an evdev device matches any of this plugin's rules."""
+        # Pre-parse rules once: exact VID/PID pairs are packed as (vid << 16) | pid
+        # into a set for a single hash lookup, name patterns are compiled for
+        # the fallback scan
+        packed_ids: set[int] = set()
+        self._name_rules: list[re.Pattern] = []
         for rule in self.devices:
+            if not isinstance(rule, dict):
+                raise ValueError(f"Device rule must be an object: {rule!r}")
             vid = rule.get("vendor_id")
             pid = rule.get("product_id")
             pattern = rule.get("name_pattern")
 
-            # VID/PID matching
             if vid is not None and pid is not None:
                 vid_int = int(vid, 16) if isinstance(vid, str) else vid
                 pid_int = int(pid, 16) if isinstance(pid, str) else pid
-                if device.info.vendor == vid_int and device.info.product == pid_int:
-                    return True
+                if not all(isinstance(i, int) and not isinstance(i, bool) for i in (vid_int, pid_int)):
+                    raise ValueError(f"VID/PID must be integers or hex strings: {vid!r}:{pid!r}")
+                if not (0 <= vid_int <= 0xFFFF and 0 <= pid_int <= 0xFFFF):
+                    raise ValueError(f"VID/PID out of 16-bit range: {vid}:{pid}")
+                packed_ids.add((vid_int << 16) | pid_int)
 
-            # Name pattern matching
             if pattern is not None:
-                if re.search(pattern, device.name, re.IGNORECASE):
-                    return True
+                if not isinstance(pattern, str):
+                    raise ValueError(f"name_pattern must be a string: {pattern!r}")
+                self._name_rules.append(_compile_name_re(pattern))
+
+        self._packed_ids: frozenset[int] = frozenset(packed_ids)
+
+        # Fold all name patterns into one alternation so a single regex pass
+        # covers every rule. Capture groups would be renumbered (breaking
+        # backreferences) and inline flags can't be combined, so such
+        # patterns keep the per-rule scan.
+        if len(self._name_rules) > 1 and not any(regex.groups for regex in self._name_rules):
+            combined = "|".join(f"(?:{regex.pattern})" for regex in self._name_rules)
+            try:
+                self._name_rules = [_compile_name_re(combined)]
+            except re.error:
+                pass
 
-        return False
+    def matches(self, device: evdev.InputDevice) -> bool:
+        """Check if an evdev device matches any of this plugin's rules."""
+        return self._match(device.name, device.info.vendor, device.info.product)
+
+    def matches_info(self, info: PluginDeviceInfo) -> bool:
+        """Check if an already captured device matches any of this plugin's rules."""
+        return self._match(info.name, info.vendor_id, info.product_id)
+
+    def _match(self, name: str, vendor_id: int, product_id: int) -> bool:
+        # VID/PID matching
+        if (vendor_id << 16) | product_id in self._packed_ids:
+            return True
+
+        # Name pattern matching
+        return any(regex.search(name) for regex in self._name_rules)
+
+
+@dataclass(frozen=True, slots=True)
+class PluginMetadata:
+    """Validated contents of a plugin's plugin.json."""
+    name: str
+    panel_class: str
+    devices: tuple[dict, ...]
+    panel_title: Optional[str] = None
+    version: Optional[str] = None
+    author: Optional[str] = None
+    description: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, metadata: dict) -> "PluginMetadata":
+        """Build from a parsed plugin.json that contains all required fields."""
+        return cls(
+            name=metadata["name"],
+            panel_class=metadata["panel_class"],
+            devices=tuple(metadata["devices"]),
+            panel_title=metadata.get("panel_title"),
+            version=metadata.get("version"),
+            author=metadata.get("author"),
+            description=metadata.get("description"),
+        )
 
 
 class LoadedPlugin:
     """Represents a successfully loaded plugin."""
-    def __init__(self, name: str, metadata: dict, module, panel_class: type,
+    __slots__ = ("name", "metadata", "module", "panel_class", "matcher", "path",
+                 "panel_instance", "connected_devices")
+
+    def __init__(self, name: str, metadata: PluginMetadata, module, panel_class: type,
                  matcher: PluginMatcher, path: str):
-        self.name = name
+        self.name = sys.intern(name)            # Used as the _plugins key
         self.metadata = metadata
         self.module = module
         self.panel_class = panel_class
         self.matcher = matcher
-        self.path = path
+        self.path = sys.intern(path)
         self.panel_instance: Optional[PluginPanel] = None
         self.connected_devices: list[PluginDeviceInfo] = []
 
+    def ensure_panel(self, button_callback: Callable, context: PluginContext) -> PluginPanel:
+        """Instantiate the panel on first use and return the cached instance."""
+        if self.panel_instance is None:
+            title = self.metadata.panel_title or self.name
+            self.panel_instance = self.panel_class(title, button_callback, context)
+        return self.panel_instance
+
 
 class PluginManager(EventDispatcher):
     """
@@ -64,18 +148,30 @@ class PluginManager(EventDispatcher):
 
         self._config_path = os.path.expanduser(config_path)
         self._plugins_path = os.path.join(self._config_path, "plugins")
+        self._metadata_cache_path = os.path.join(self._config_path, ".plugins.cache.json")
+        self._metadata_cache: dict[str, list] = {}  # plugin.json path -> [mtime_ns, size, metadata]
+        self._metadata_cache_dirty = False
+        self._prefetched: dict[str, list | Exception] = {}  # plugin.json path -> cache entry or read error
         self._hid_handler = hid_handler
         self._settings_handler = settings_handler
 
         self._plugins: dict[str, LoadedPlugin] = {}
         self._plugins_lock = Lock()
+        # Device path -> plugins holding that device, so disconnects skip the full scan
+        self._path_index: dict[str, list[tuple[LoadedPlugin, PluginDeviceInfo]]] = {}
+        # Bumped whenever plugins, their devices or panels change; guards the cached lookups below
+        self._plugins_version = 0
+        self._active_cache: Optional[tuple[int, dict[str, PluginPanel]]] = None
+        self._preset_index: Optional[tuple[int, dict[str, PluginPanel]]] = None
+        # Panels that became available during the current device scan, dispatched as one batch
+        self._pending_panels: dict[str, Callable[[], Optional[PluginPanel]]] = {}
 
         self._device_scan_thread: Optional[Thread] = None
         self._running = Event()
         self._button_callback: Optional[Callable] = None
 
         # Events for the main app to react to
-        self._register_event("plugin-panel-available")    # (plugin_name, panel_instance)
+        self._register_event("plugin-panels-updated")     # ({plugin_name: get_panel})
         self._register_event("plugin-panel-unavailable")  # (plugin_name)
         self._register_event("plugin-load-error")         # (plugin_name, error_message)
 
@@ -107,10 +203,100 @@ class PluginManager(EventDispatcher):
         if not os.path.exists(self._plugins_path):
             return
 
-        for entry in os.listdir(self._plugins_path):
-            plugin_dir = os.path.join(self._plugins_path, entry)
-            if os.path.isdir(plugin_dir):
-                self._load_plugin(entry, plugin_dir)
+        self._load_metadata_cache()
+        seen: set[str] = set()
+
+        # DirEntry.is_dir() uses the type from the directory listing and only
+        # stats symlinks, which are still followed so linked plugins load
+        with os.scandir(self._plugins_path) as entries:
+            plugin_dirs = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+
+        # Read plugin.json files in parallel to overlap disk latency; the
+        # results are merged into the cache as each plugin is loaded below,
+        # where plugin modules are still imported one at a time
+        if len(plugin_dirs) > 1:
+            keys = [os.path.abspath(os.path.join(plugin_dir, "plugin.json")) for _, plugin_dir in plugin_dirs]
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                self._prefetched = dict(zip(keys, executor.map(self._fetch_metadata, keys)))
+
+        for entry, plugin_dir in plugin_dirs:
+            seen.add(os.path.abspath(os.path.join(plugin_dir, "plugin.json")))
+            self._load_plugin(entry, plugin_dir)
+        self._prefetched = {}
+
+        # Forget plugins that were removed since the last discovery
+        for key in self._metadata_cache.keys() - seen:
+            del self._metadata_cache[key]
+            self._metadata_cache_dirty = True
+
+        if self._metadata_cache_dirty:
+            self._save_metadata_cache()
+
+    def _load_metadata_cache(self) -> None:
+        """Load parsed plugin.json files cached by a previous discovery."""
+        self._metadata_cache = {}
+        self._metadata_cache_dirty = False
+        try:
+            with open(self._metadata_cache_path, 'rb') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(cache, dict):
+            return
+
+        # Keep only well-formed [mtime_ns, size, metadata] entries; anything
+        # else is treated as a miss and rewritten on the next save
+        self._metadata_cache = {
+            key: entry for key, entry in cache.items()
+            if isinstance(entry, list) and len(entry) == 3
+            and type(entry[0]) is int and type(entry[1]) is int
+            and isinstance(entry[2], dict)
+        }
+        self._metadata_cache_dirty = len(self._metadata_cache) != len(cache)
+
+    def _save_metadata_cache(self) -> None:
+        """Atomically write the plugin.json cache next to the plugins directory."""
+        tmp_path = self._metadata_cache_path + ".tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._metadata_cache, f)
+            os.replace(tmp_path, self._metadata_cache_path)
+            self._metadata_cache_dirty = False
+        except OSError as e:
+            print(f"[PluginManager] Could not write plugin cache: {e}")
+
+    def _fetch_metadata(self, key: str) -> list | Exception:
+        """Return the [mtime_ns, size, metadata] cache entry for a plugin.json, or the read error.
+
+        Only reads the cache, so discovery can run it on worker threads.
+        """
+        try:
+            stat = os.stat(key)
+            entry = self._metadata_cache.get(key)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                return entry
+
+            with open(key, 'rb') as f:
+                metadata = _json_loads(f.read())
+        except (OSError, ValueError) as e:
+            return e
+
+        return [stat.st_mtime_ns, stat.st_size, metadata]
+
+    def _read_metadata(self, metadata_file: str) -> dict:
+        """Read plugin.json, reusing the prefetched or cached copy if the file is unchanged."""
+        key = os.path.abspath(metadata_file)
+        entry = self._prefetched.pop(key, None)
+        if entry is None:
+            entry = self._fetch_metadata(key)
+        if isinstance(entry, Exception):
+            raise entry
+
+        if self._metadata_cache.get(key) is not entry:
+            self._metadata_cache[key] = entry
+            self._metadata_cache_dirty = True
+        return entry[2]
 
     def _load_plugin(self, name: str, path: str) -> bool:
         """Load a single plugin from its directory."""
@@ -130,8 +316,7 @@ class PluginManager(EventDispatcher):
 
         # Load metadata
         try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+            metadata = self._read_metadata(metadata_file)
         except json.JSONDecodeError as e:
             self._dispatch("plugin-load-error", name, f"Invalid plugin.json: {e}")
             print(f"[PluginManager] Plugin '{name}': Invalid plugin.json: {e}")
@@ -145,21 +330,23 @@ class PluginManager(EventDispatcher):
                 print(f"[PluginManager] Plugin '{name}': Missing field: {field}")
                 return False
 
+        if not isinstance(metadata["devices"], list):
+            self._dispatch("plugin-load-error", name, "Field 'devices' must be a list")
+            print(f"[PluginManager] Plugin '{name}': Field 'devices' must be a list")
+            return False
+
+        plugin_metadata = PluginMetadata.from_dict(metadata)
+
         # Load the plugin module
         try:
-            module_name = f"foxblat_plugin_{name}"
-            spec = importlib.util.spec_from_file_location(module_name, init_file,
-                submodule_search_locations=[path])
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
+            module = self._import_plugin_module(name, path, init_file)
         except Exception as e:
             self._dispatch("plugin-load-error", name, f"Failed to load module: {e}")
             print(f"[PluginManager] Plugin '{name}': Failed to load module: {e}")
             return False
 
         # Get the panel class
-        panel_class_name = metadata["panel_class"]
+        panel_class_name = plugin_metadata.panel_class
         if not hasattr(module, panel_class_name):
             self._dispatch("plugin-load-error", name, f"Panel class not found: {panel_class_name}")
             print(f"[PluginManager] Plugin '{name}': Panel class not found: {panel_class_name}")
@@ -174,21 +361,43 @@ class PluginManager(EventDispatcher):
             return False
 
         # Create matcher and store plugin
-        matcher = PluginMatcher(name, metadata)
+        try:
+            matcher = PluginMatcher(name, metadata)
+        except (ValueError, re.error) as e:
+            self._dispatch("plugin-load-error", name, f"Invalid device rule: {e}")
+            print(f"[PluginManager] Plugin '{name}': Invalid device rule: {e}")
+            return False
 
         with self._plugins_lock:
-            self._plugins[name] = LoadedPlugin(
+            plugin = LoadedPlugin(
                 name=name,
-                metadata=metadata,
+                metadata=plugin_metadata,
                 module=module,
                 panel_class=panel_class,
                 matcher=matcher,
                 path=path
             )
+            self._plugins[plugin.name] = plugin
+            self._plugins_version += 1
 
-        print(f"[PluginManager] Loaded plugin: {metadata.get('name', name)}")
+        print(f"[PluginManager] Loaded plugin: {plugin_metadata.name}")
         return True
 
+    def _import_plugin_module(self, name: str, path: str, init_file: str):
+        """Import a plugin package, dropping it from sys.modules again if it fails."""
+        module_name = f"foxblat_plugin_{name}"
+        spec = importlib.util.spec_from_file_location(module_name, init_file,
+            submodule_search_locations=[path])
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            del sys.modules[module_name]
+            raise
+
+        return module
+
     def _start_device_monitoring(self) -> None:
         """Start background thread that monitors for device changes."""
         self._running.set()
@@ -229,57 +438,74 @@ class PluginManager(EventDispatcher):
             for path in removed_paths:
                 self._handle_device_disconnected(path)
 
+            self._flush_pending_panels()
+
             known_devices = current_paths
             sleep(3)
 
     def _handle_device_connected(self, device: evdev.InputDevice) -> None:
         """Check if any plugin handles this device."""
+        # Read the evdev attributes once and share them between all matching plugins
+        device_info = PluginDeviceInfo(
+            name=device.name,
+            vendor_id=device.info.vendor,
+            product_id=device.info.product,
+            path=device.path
+        )
+
         with self._plugins_lock:
             for plugin in self._plugins.values():
-                if plugin.matcher.matches(device):
-                    device_info = PluginDeviceInfo(
-                        name=device.name,
-                        vendor_id=device.info.vendor,
-                        product_id=device.info.product,
-                        path=device.path
-                    )
-                    plugin.connected_devices.append(device_info)
-
-                    print(f"[PluginManager] Device matched plugin '{plugin.name}': {device.name}")
-
-                    # Create panel instance if first device and we have a button callback
-                    panel_just_created = False
+                if plugin.matcher.matches_info(device_info):
+                    self._add_connected_device(plugin, device_info)
+
+                    print(f"[PluginManager] Device matched plugin '{plugin.name}': {device_info.name}")
+
+                    # Panel creation is deferred until the UI asks for it through the
+                    # event's getter, which also keeps GTK work off this thread
                     if plugin.panel_instance is None and self._button_callback is not None:
-                        self._instantiate_plugin_panel(plugin)
-                        panel_just_created = True
+                        self._pending_panels[plugin.name] = partial(self.ensure_plugin_panel, plugin.name)
 
-                    # Notify the panel (skip if panel was just created, as _instantiate_plugin_panel already notified)
-                    if plugin.panel_instance and not panel_just_created:
+                    # Notify an existing panel (a new panel is notified when it gets created)
+                    elif plugin.panel_instance:
                         try:
                             plugin.panel_instance.on_device_connected(device_info)
                             plugin.panel_instance.active(1)
                         except Exception as e:
                             print(f"[PluginManager] Error notifying panel: {e}")
 
+    def _flush_pending_panels(self) -> None:
+        """Announce all panels that became available since the last flush in one event."""
+        with self._plugins_lock:
+            pending = self._pending_panels
+            self._pending_panels = {}
+
+        if pending:
+            self._dispatch("plugin-panels-updated", pending)
+
     def _handle_device_disconnected(self, path: str) -> None:
         """Notify plugins when a device disconnects."""
         with self._plugins_lock:
-            for plugin in self._plugins.values():
-                for device_info in plugin.connected_devices[:]:
-                    if device_info.path == path:
-                        plugin.connected_devices.remove(device_info)
+            for plugin, device_info in self._path_index.pop(path, ()):
+                plugin.connected_devices.remove(device_info)
+                self._plugins_version += 1
 
-                        print(f"[PluginManager] Device disconnected from plugin '{plugin.name}': {device_info.name}")
+                print(f"[PluginManager] Device disconnected from plugin '{plugin.name}': {device_info.name}")
 
-                        if plugin.panel_instance:
-                            try:
-                                plugin.panel_instance.on_device_disconnected(device_info)
-                            except Exception as e:
-                                print(f"[PluginManager] Error notifying panel: {e}")
+                if plugin.panel_instance:
+                    try:
+                        plugin.panel_instance.on_device_disconnected(device_info)
+                    except Exception as e:
+                        print(f"[PluginManager] Error notifying panel: {e}")
+
+                # Hide panel if no devices left
+                if len(plugin.connected_devices) == 0 and plugin.panel_instance:
+                    plugin.panel_instance.active(-1)
 
-                        # Hide panel if no devices left
-                        if len(plugin.connected_devices) == 0 and plugin.panel_instance:
-                            plugin.panel_instance.active(-1)
+    def _add_connected_device(self, plugin: LoadedPlugin, device_info: PluginDeviceInfo) -> None:
+        """Track a matched device on the plugin and in the path index."""
+        plugin.connected_devices.append(device_info)
+        self._path_index.setdefault(sys.intern(device_info.path), []).append((plugin, device_info))
+        self._plugins_version += 1
 
     def _instantiate_plugin_panel(self, plugin: LoadedPlugin) -> None:
         """Create a panel instance for a plugin."""
@@ -291,10 +517,8 @@ class PluginManager(EventDispatcher):
                 config_path=self._config_path
             )
 
-            title = plugin.metadata.get("panel_title", plugin.name)
-            plugin.panel_instance = plugin.panel_class(
-                title, self._button_callback, context
-            )
+            plugin.ensure_panel(self._button_callback, context)
+            self._plugins_version += 1
 
             # Initialize panel as inactive (same as built-in panels in app.py)
             # This resets _active to False so active(1) will work properly
@@ -310,12 +534,25 @@ class PluginManager(EventDispatcher):
             if len(plugin.connected_devices) > 0:
                 plugin.panel_instance.active(1)
 
-            self._dispatch("plugin-panel-available", plugin.name, plugin.panel_instance)
-
         except Exception as e:
             self._dispatch("plugin-load-error", plugin.name, f"Failed to instantiate panel: {e}")
             print(f"[PluginManager] Error creating panel for {plugin.name}: {e}")
 
+    def ensure_plugin_panel(self, plugin_name: str) -> Optional[PluginPanel]:
+        """
+        Return the panel for a plugin, creating it on first request.
+        Must be called from the GTK main thread.
+        """
+        with self._plugins_lock:
+            plugin = self._plugins.get(plugin_name)
+            if plugin is None:
+                return None
+
+            if plugin.panel_instance is None:
+                self._instantiate_plugin_panel(plugin)
+
+            return plugin.panel_instance
+
     def get_plugin_panels(self, button_callback: Callable) -> dict[str, PluginPanel]:
         """
         Get all plugin panels for plugins that have connected devices.
@@ -331,7 +568,7 @@ class PluginManager(EventDispatcher):
                         self._instantiate_plugin_panel(plugin)
 
                     if plugin.panel_instance:
-                        title = plugin.metadata.get("panel_title", plugin.name)
+                        title = plugin.metadata.panel_title or plugin.name
                         panels[title] = plugin.panel_instance
 
         return panels
@@ -343,41 +580,57 @@ class PluginManager(EventDispatcher):
 
     def get_active_plugins(self) -> dict[str, PluginPanel]:
         """Get all plugins with connected devices (for preset UI)."""
-        panels = {}
         with self._plugins_lock:
+            if self._active_cache is None or self._active_cache[0] != self._plugins_version:
+                panels = {
+                    plugin.panel_instance.preset_device_name: plugin.panel_instance
+                    for plugin in self._plugins.values()
+                    if plugin.panel_instance and plugin.connected_devices
+                }
+                self._active_cache = (self._plugins_version, panels)
+
+            return dict(self._active_cache[1])
+
+    def _get_preset_index(self) -> dict[str, PluginPanel]:
+        """
+        Map preset device names to plugin panels, rebuilt only when plugin state changes.
+        Caller must hold _plugins_lock.
+        """
+        if self._preset_index is None or self._preset_index[0] != self._plugins_version:
+            index = {}
             for plugin in self._plugins.values():
-                if plugin.panel_instance and len(plugin.connected_devices) > 0:
-                    panels[plugin.panel_instance.preset_device_name] = plugin.panel_instance
-        return panels
+                if plugin.panel_instance:
+                    index.setdefault(plugin.panel_instance.preset_device_name, plugin.panel_instance)
+            self._preset_index = (self._plugins_version, index)
+
+        return self._preset_index[1]
 
     def get_plugin_preset_settings(self, device_name: str) -> dict:
         """Get preset settings from a plugin by its preset device name."""
         with self._plugins_lock:
-            for plugin in self._plugins.values():
-                if plugin.panel_instance:
-                    if plugin.panel_instance.preset_device_name == device_name:
-                        try:
-                            return plugin.panel_instance.get_preset_settings()
-                        except Exception as e:
-                            print(f"[PluginManager] Error getting preset settings from {device_name}: {e}")
+            panel = self._get_preset_index().get(device_name)
+            if panel is not None:
+                try:
+                    return panel.get_preset_settings()
+                except Exception as e:
+                    print(f"[PluginManager] Error getting preset settings from {device_name}: {e}")
         return {}
 
     def apply_plugin_preset_settings(self, device_name: str, settings: dict) -> None:
         """Apply preset settings to a plugin by its preset device name."""
         with self._plugins_lock:
-            for plugin in self._plugins.values():
-                if plugin.panel_instance:
-                    if plugin.panel_instance.preset_device_name == device_name:
-                        try:
-                            plugin.panel_instance.on_preset_loaded(settings)
-                            print(f"[PluginManager] Applied preset settings to {device_name}")
-                        except Exception as e:
-                            print(f"[PluginManager] Error applying preset settings to {device_name}: {e}")
-                        return
+            index = self._get_preset_index()
+            panel = index.get(device_name)
+            if panel is not None:
+                try:
+                    panel.on_preset_loaded(settings)
+                    print(f"[PluginManager] Applied preset settings to {device_name}")
+                except Exception as e:
+                    print(f"[PluginManager] Error applying preset settings to {device_name}: {e}")
+                return
 
             # No matching plugin found - log for debugging
-            available = [p.panel_instance.preset_device_name for p in self._plugins.values() if p.panel_instance]
-            print(f"[PluginManager] No plugin found for preset device '{device_name}'. Available: {available}")
+            print(f"[PluginManager] No plugin found for preset device '{device_name}'. Available: {list(index)}")
 
     def has_active_plugins(self) -> bool:
         """Check if any plugins have connected devices."""
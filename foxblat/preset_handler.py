@@ -6,6 +6,7 @@ import yaml
 import os
 from threading import Thread
 from .subscription import SimpleEventDispatcher
+from .yaml_io import YamlLoader, YamlDumper
 from time import sleep
 
 MozaDevicePresetSettings = {
@@ -312,16 +313,23 @@ class MozaPresetHandler(SimpleEventDispatcher):
         if not os.path.isfile(path):
             return
 
-        with open(path, "r") as file:
-            return yaml.safe_load(file.read())
+        # Bytes in one read; the YAML reader handles the UTF-8 decoding itself
+        with open(path, "rb") as file:
+            return yaml.load(file.read(), Loader=YamlLoader)
 
 
     def _set_preset_data(self, preset_data: dict) -> None:
-        if not os.path.exists(self._path):
-            os.makedirs(self._path)
-
-        with open(os.path.join(self._path, self._name), "w") as file:
-            file.write(yaml.safe_dump(preset_data))
+        path = os.path.join(self._path, self._name)
+        # Only touch the directory when the open fails, saves usually go to an existing one
+        try:
+            file = open(path, "w")
+        except FileNotFoundError:
+            os.makedirs(self._path, exist_ok=True)
+            file = open(path, "w")
+
+        # Emit straight into the file instead of building the whole document string
+        with file:
+            yaml.dump(preset_data, stream=file, Dumper=YamlDumper)
 
 
     def get_linked_process(self) -> str:
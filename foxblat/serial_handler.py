@@ -11,6 +11,9 @@ from time import sleep
 
 from foxblat.moza_command import MozaCommand
 
+# Valid payload lengths following the start byte
+SERIAL_PAYLOAD_LENGTHS = range(2, 12)
+
 
 class SerialHandler(SimpleEventDispatcher):
     def __init__(self, serial_path: str, msg_start: int, device_name: str):
@@ -101,7 +104,7 @@ class SerialHandler(SimpleEventDispatcher):
                     continue
 
                 payload_length = int().from_bytes(self._serial.read(1))
-                if not 2 <= payload_length <= 11:
+                if payload_length not in SERIAL_PAYLOAD_LENGTHS:
                     continue
 
                 self._read_queue.put(self._serial.read(payload_length + 2))
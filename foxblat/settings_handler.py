@@ -2,6 +2,8 @@ import yaml
 from os import path, makedirs
 from threading import Lock
 from typing import Any
+from .yaml_io import YamlLoader, YamlDumper
+
 
 class SettingsHandler():
     def __init__(self, config_path: str) -> None:
@@ -18,12 +20,12 @@ class SettingsHandler():
 
     def _get_file_contents(self) -> dict:
         with self._file_lock, open(self._settings_file, "r") as file:
-            return yaml.safe_load(file) or {}
+            return yaml.load(file, Loader=YamlLoader) or {}
 
 
     def _write_to_file(self, settings_data: Any) -> None:
         with self._file_lock, open(self._settings_file, "w") as file:
-            yaml.safe_dump(settings_data, file)
+            yaml.dump(settings_data, file, Dumper=YamlDumper)
 
 
     def write_setting(self, setting_value, setting_name: str) -> None:
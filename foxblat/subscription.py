@@ -1,13 +1,16 @@
 # Copyright (c) 2025, Tomasz Pakuła Using Arch BTW
 
-from threading import Thread, Event
-from queue import SimpleQueue
+import sys
+from threading import Thread, Condition, Lock
 
 
 class Subscription():
+    __slots__ = ("_callback", "_args", "_once")
+
     def __init__(self, callback, *args):
         self._callback = callback
         self._args: tuple = args
+        self._once = False
 
 
     def call(self, *values):
@@ -21,18 +24,19 @@ class Subscription():
 
 class SubscriptionList():
     def __init__(self):
-        self._subscriptions: list[Subscription] = []
-        self._single_time_subs: SimpleQueue[Subscription] = SimpleQueue()
+        # Keyed by id() so removal doesn't scan, dict order keeps call order
+        self._subscriptions: dict[int, Subscription] = {}
+        # Copy-on-write view for dispatch, replaced whole on every change
+        self._snapshot: tuple[Subscription, ...] = ()
+        self._lock = Lock()
 
 
     def count(self) -> int:
-        count = len(self._subscriptions)
-        count += self._single_time_subs.qsize()
-        return count
+        return len(self._subscriptions)
 
 
     def get(self, index: int) -> Subscription:
-        return self._subscriptions[index]
+        return self._snapshot[index]
 
 
     def append(self, callback, *args) -> Subscription:
@@ -40,7 +44,7 @@ class SubscriptionList():
             return
 
         sub = Subscription(callback, *args)
-        self._subscriptions.append(sub)
+        self.append_subscription(sub)
         return sub
 
 
@@ -49,47 +53,48 @@ class SubscriptionList():
             return None
 
         sub = Subscription(callback, *args)
-        self._single_time_subs.put(sub)
+        sub._once = True
+        self.append_subscription(sub)
         return sub
 
 
-    def remove(self, sub: Subscription):
-        if sub in self._subscriptions:
-            self._subscriptions.remove(sub)
-            return
+    def remove(self, sub: Subscription) -> bool:
+        with self._lock:
+            if self._subscriptions.pop(id(sub), None) is None:
+                return False
 
-        tmp = None
-        for i in range(self._single_time_subs.qsize()):
-            tmp = self._single_time_subs.get()
-            if tmp is sub:
-                break
-            self._single_time_subs.put(tmp)
+            self._snapshot = tuple(self._subscriptions.values())
+            return True
 
 
     def append_subscription(self, subscription: Subscription):
-        self._subscriptions.append(subscription)
+        with self._lock:
+            self._subscriptions[id(subscription)] = subscription
+            self._snapshot = tuple(self._subscriptions.values())
 
 
     def call(self, *values):
-        for sub in self._subscriptions:
-            sub.call(*values)
-
-        while not self._single_time_subs.empty():
-            self._single_time_subs.get().call(*values)
+        remove = self.remove
+        # Same as sub.call(*values), inlined to skip a frame per subscriber
+        for sub in self._snapshot:
+            # One-shot subs are claimed before the call so concurrent dispatches fire them once
+            if sub._once and not remove(sub):
+                continue
+            sub._callback(*values, *sub._args)
 
 
     def call_custom_args(self, *args):
-        for sub in self._subscriptions:
-            sub.call_custom_args(*args)
-
-        while not self._single_time_subs.empty():
-            self._single_time_subs.get().call_custom_args(*args)
+        remove = self.remove
+        for sub in self._snapshot:
+            if sub._once and not remove(sub):
+                continue
+            sub._callback(*args)
 
 
     def clear(self):
-        self._subscriptions.clear()
-        while not self._single_time_subs.empty():
-            self._single_time_subs.get()
+        with self._lock:
+            self._subscriptions.clear()
+            self._snapshot = ()
 
 
 
@@ -119,16 +124,16 @@ class EventDispatcher():
 
     def _register_event(self, event_name: str) -> bool:
         if not self.__find_event(event_name):
-            self.__events[event_name] = SubscriptionList()
+            self.__events[sys.intern(event_name)] = SubscriptionList()
             return True
         return False
         # TODO debug warn if event already exists
 
 
     def _register_events(self, *event_names: str):
-        for event in event_names:
-            self._register_event(event)
-            #print(f"Event \"{event}\" registered")
+        events = self.__events
+        # One update for the whole batch, existing events keep their subscribers
+        events.update({sys.intern(event): SubscriptionList() for event in event_names if event not in events})
 
 
     def _deregister_event(self, event_name: str) -> bool:
@@ -144,10 +149,11 @@ class EventDispatcher():
 
 
     def _dispatch(self, event_name: str, *values) -> bool:
-        if not self.__find_event(event_name):
+        subscriptions = self.__events.get(event_name)
+        if subscriptions is None:
             return False
 
-        self.__events[event_name].call(*values)
+        subscriptions.call(*values)
         return True
 
 
@@ -217,6 +223,10 @@ class SimpleEventDispatcher():
         self.__events.call(*values)
 
 
+    def _subscription_count(self) -> int:
+        return self.__events.count()
+
+
     def subscribe(self, callback, *args):
         self.__events.append(callback, *args)
 
@@ -247,29 +257,47 @@ class Observable(SimpleEventDispatcher):
 
     @value.setter
     def value(self, new_value):
-        if new_value != self._value:
+        current = self._value
+        if new_value is not current and new_value != current:
             self._dispatch(new_value)
         self._value = new_value
 
 
 
+# Marks an empty BlockingValue so None stays a valid value
+_UNSET = object()
+
+
 class BlockingValue():
+    __slots__ = ("_value", "_cond")
+
     def __init__(self):
-        self._value = None
-        self._event = Event()
+        self._value = _UNSET
+        self._cond = Condition()
+
+
+    def _has_value(self) -> bool:
+        return self._value is not _UNSET
 
 
     def set_value(self, new_value):
-        self._value = new_value
-        self._event.set()
+        with self._cond:
+            self._value = new_value
+            self._cond.notify_all()
 
 
     def get_value(self, timeout=0.05):
-        self._event.wait(timeout)
-        self._event.clear()
-        return self._value
+        with self._cond:
+            if not self._cond.wait_for(self._has_value, timeout):
+                return None
+
+            value = self._value
+            self._value = _UNSET
+            return value
 
 
     def get_value_no_clear(self, timeout=0.05):
-        self._event.wait(timeout)
-        return self._value
+        with self._cond:
+            if not self._cond.wait_for(self._has_value, timeout):
+                return None
+            return self._value
@@ -16,7 +16,7 @@ class FoxblatButtonRow(FoxblatRow):
 
 
     def get_value(self) -> int:
-        return round(eval("1" + self._expression))
+        return round(self._expression_fn(1))
 
 
     def add_button(self, button_label: str, callback=None, *args) -> Gtk.Button:
@@ -3,6 +3,9 @@
 from gi.repository import Gtk, GLib, Pango
 from .row import FoxblatRow
 
+_UNSET = object()
+
+
 class FoxblatLabelRow(FoxblatRow):
     def __init__(self, title: str, subtitle="", value=""):
         super().__init__(title, subtitle)
@@ -13,6 +16,8 @@ class FoxblatLabelRow(FoxblatRow):
         self._set_widget(label)
         self._label = label
         self._suffix = ""
+        # Last value shown through _set_value, repeated updates skip formatting and relayout
+        self._last_value = _UNSET
         self.connect("activated", lambda *_: self._dispatch())
 
 
@@ -23,12 +28,25 @@ class FoxblatLabelRow(FoxblatRow):
 
 
     def _set_value(self, value: str):
-        value = round(eval("value"+self._reverse_expression), 1)
+        # 1 and 1.0 compare equal but render differently
+        last = self._last_value
+        if value == last and type(value) is type(last):
+            return
+
+        self._last_value = value
+        value = round(self._reverse_expression_fn(value), 1)
         self._label.set_label(str(value) + self._suffix)
 
 
     def set_label(self, label):
-        GLib.idle_add(self._label.set_label, str(label) + self._suffix)
+        GLib.idle_add(self._set_label_helper, str(label) + self._suffix)
+
+
+    def _set_label_helper(self, text: str):
+        # Forget the last value only once the text is replaced, a value update
+        # queued before this one would otherwise be recorded as still shown
+        self._label.set_label(text)
+        self._last_value = _UNSET
 
 
     def get_label(self) -> str:
@@ -37,3 +55,9 @@ class FoxblatLabelRow(FoxblatRow):
 
     def set_suffix(self, suffix: str):
         self._suffix = str(suffix)
+        self._last_value = _UNSET
+
+
+    def set_reverse_expression(self, expr: str):
+        super().set_reverse_expression(expr)
+        self._last_value = _UNSET
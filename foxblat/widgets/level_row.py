@@ -9,6 +9,7 @@ class FoxblatLevelRow(FoxblatRow):
         super().__init__(title, subtitle)
 
         self._max_value = max_value
+        self._inv_max = self._inverse(max_value)
 
         bar = Gtk.LevelBar()
         bar.set_mode(Gtk.LevelBarMode.CONTINUOUS)
@@ -34,20 +35,23 @@ class FoxblatLevelRow(FoxblatRow):
         if not self.get_active():
             return
 
-        if value > self._max_value:
-            value = self._max_value
-
-        if value < 0:
-            value = 0
-
+        max_value = self._max_value
+        value = 0 if value < 0 else max_value if value > max_value else value
         self._bar.set_value(value)
 
 
     def set_bar_max(self, value: int):
         self._max_value = value
+        self._inv_max = self._inverse(value)
         self._bar.set_max_value(value)
 
 
+    @staticmethod
+    def _inverse(max_value) -> float:
+        # Fractions are read on every level update, keep them to a multiply
+        return 1.0 / max_value if max_value else 0.0
+
+
     def set_bar_width(self, width: int):
         self._bar.set_size_request(width, 0)
 
@@ -77,7 +81,7 @@ class FoxblatLevelRow(FoxblatRow):
 
 
     def get_fraction(self) -> float:
-        return self._bar.get_value()  / self._bar.get_max_value()
+        return self._bar.get_value() * self._inv_max
 
 
     def get_percent(self) -> int:
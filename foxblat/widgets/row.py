@@ -5,9 +5,36 @@ gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, GLib
 import time
-from threading import Event
+from functools import lru_cache
 from foxblat.subscription import SimpleEventDispatcher
 
+
+class _Flag():
+    """Event-like set/clear/is_set over a plain bool, without the Event's lock"""
+    __slots__ = ("_value",)
+
+    def __init__(self):
+        self._value = False
+
+
+    def set(self):
+        self._value = True
+
+
+    def clear(self):
+        self._value = False
+
+
+    def is_set(self) -> bool:
+        return self._value
+
+
+@lru_cache(maxsize=None)
+def _compile_expression(expr: str):
+    # Same text concatenation the rows used to eval per call, compiled once per expression
+    return eval(f"lambda value: value{expr}")
+
+
 class FoxblatRow(Adw.ActionRow, SimpleEventDispatcher):
     def __init__(self, title="", subtitle="", init_adw=True):
         if init_adw:
@@ -15,13 +42,15 @@ class FoxblatRow(Adw.ActionRow, SimpleEventDispatcher):
         SimpleEventDispatcher.__init__(self)
 
         self._cooldown = 0
-        self._mute = Event()
+        self._mute = _Flag()
         self._shutdown = False
         self.set_sensitive(True)
         self.set_title(title)
         self.set_subtitle(subtitle)
         self._expression = "*1"
         self._reverse_expression = "*1"
+        self._expression_fn = _compile_expression("*1")
+        self._reverse_expression_fn = self._expression_fn
         self._active = True
         self._cooldown_increment = 1
 
@@ -118,6 +147,10 @@ class FoxblatRow(Adw.ActionRow, SimpleEventDispatcher):
             return
 
         self._cooldown = self._cooldown_increment
+        # Nobody listening, skip computing the value
+        if not self._subscription_count():
+            return
+
         self._dispatch(self.get_value())
 
 
@@ -126,6 +159,7 @@ class FoxblatRow(Adw.ActionRow, SimpleEventDispatcher):
         Modify the value when invoking get_value()
         """
         self._expression = expr
+        self._expression_fn = _compile_expression(expr)
 
 
     def set_reverse_expression(self, expr: str):
@@ -133,6 +167,7 @@ class FoxblatRow(Adw.ActionRow, SimpleEventDispatcher):
         Modify the value when invoking set_value()
         """
         self._reverse_expression = expr
+        self._reverse_expression_fn = _compile_expression(expr)
 
 
     def shutdown(self):
@@ -144,9 +179,12 @@ class FoxblatRow(Adw.ActionRow, SimpleEventDispatcher):
 
 
     def cooldown(self) -> bool:
-        ret = (self._cooldown != 0)
+        cooldown = self._cooldown
+        if not cooldown:
+            return False
 
-        if self._cooldown > 0:
-            self._cooldown -= 1
+        # Negative cooldown holds until reset, positive counts down per check
+        if cooldown > 0:
+            self._cooldown = cooldown - 1
 
-        return ret
+        return True
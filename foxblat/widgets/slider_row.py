@@ -15,6 +15,10 @@ class FoxblatSliderRow(FoxblatRow):
         self._increment = increment
         self._range_start = range_start
         self._range_end = range_end
+        # get_value() result as (generation, value); a slider or expression change
+        # bumps the generation, including one that lands while get_value computes
+        self._value_gen = 0
+        self._value_cache = (-1, None)
 
         slider.set_range(range_start, range_end)
         slider.set_increments(increment, 0)
@@ -26,6 +30,8 @@ class FoxblatSliderRow(FoxblatRow):
         slider.set_valign(Gtk.Align.CENTER)
         self.add_marks(range_start, range_end)
 
+        # Invalidate first so _notify and its subscribers see the new value
+        slider.connect('value-changed', self._invalidate_value)
         slider.connect('value-changed', self._notify)
 
         if big:
@@ -72,8 +78,22 @@ class FoxblatSliderRow(FoxblatRow):
         self._slider.set_size_request(width, 0)
 
 
+    def _invalidate_value(self, *rest):
+        self._value_gen += 1
+
+
+    def set_expression(self, expr: str):
+        super().set_expression(expr)
+        self._value_gen += 1
+
+
     def get_value(self) -> int:
-        return round(eval("self._slider.get_value()" + self._expression))
+        gen, value = self._value_cache
+        if gen != self._value_gen:
+            gen = self._value_gen
+            value = round(self._expression_fn(self._slider.get_value()))
+            self._value_cache = (gen, value)
+        return value
 
 
     def get_raw_value(self) -> int:
@@ -81,7 +101,7 @@ class FoxblatSliderRow(FoxblatRow):
 
 
     def _set_value(self, value: int):
-        value = round(eval("value"+self._reverse_expression))
+        value = round(self._reverse_expression_fn(value))
         if value < self._range_start:
             value = self._range_start
 
@@ -27,7 +27,7 @@ class FoxblatSwitchRow(FoxblatRow):
         if self._reverse:
             val = not val
 
-        return round(eval("int(val)" + self._expression))
+        return round(self._expression_fn(int(val)))
 
 
     def reverse_values(self):
@@ -38,7 +38,7 @@ class FoxblatSwitchRow(FoxblatRow):
         if value < 0:
             return
 
-        val = round(eval("value"+self._reverse_expression))
+        val = round(self._reverse_expression_fn(value))
         if val < 0:
             val = 0
         if self._reverse:
@@ -36,7 +36,7 @@ class FoxblatToggleButtonRow(FoxblatRow):
             if button.get_active():
                 val = i
 
-        return round(eval("val" + self._expression))
+        return round(self._expression_fn(val))
 
 
     def _set_value(self, value: int):
@@ -45,13 +45,10 @@ class FoxblatToggleButtonRow(FoxblatRow):
                 button.set_active(False)
             return
 
-        value = round(eval("value"+self._reverse_expression))
-
-        if value < 0:
-            value = 0
-        elif value >= len(self._buttons):
-            value = len(self._buttons)-1
+        value = round(self._reverse_expression_fn(value))
 
+        last = len(self._buttons) - 1
+        value = 0 if value < 0 else last if value > last else value
         self._buttons[value].set_active(True)
 
 
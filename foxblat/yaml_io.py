@@ -0,0 +1,5 @@
+import yaml
+
+# libyaml bindings when available, same safe semantics as safe_load/safe_dump
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
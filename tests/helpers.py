@@ -0,0 +1,31 @@
+# Copyright (c) 2026, R. Orth (giantorth)
+"""
+Shared fixtures for the Foxblat unit tests.
+"""
+
+import unittest
+import os
+import tempfile
+import shutil
+
+# Keep fixture files in memory when a tmpfs is available
+_TMP_PARENT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+class TempRootTestCase(unittest.TestCase):
+    """Creates one temporary root per class and a fresh self.tmpdir inside it per test."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._root = tempfile.mkdtemp(dir=_TMP_PARENT)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root)
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = os.path.join(self._root, self._testMethodName)
+        os.mkdir(self.tmpdir)
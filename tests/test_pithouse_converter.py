@@ -109,6 +109,19 @@ class TestPithouseValidation(unittest.TestCase):
         self.assertIn("version", error)
 
 
+    def test_validate_and_convert_valid(self):
+        result, error = self.converter._validate_and_convert(_make_valid_pithouse())
+        self.assertEqual(error, "")
+        self.assertEqual(result["base"]["ffb-strength"], 800)
+
+    def test_validate_and_convert_invalid(self):
+        data = _make_valid_pithouse()
+        data["deviceParams"]["version"] = 1
+        result, error = self.converter._validate_and_convert(data)
+        self.assertIsNone(result)
+        self.assertIn("version", error)
+
+
 class TestPithouseGetName(unittest.TestCase):
     """Test preset name extraction."""
 
@@ -127,75 +140,46 @@ class TestPithouseGetName(unittest.TestCase):
 class TestPithouseConversion(unittest.TestCase):
     """Test Pithouse to Foxblat preset conversion."""
 
-    def setUp(self):
-        self.converter = PithouseConverter()
+    @classmethod
+    def setUpClass(cls):
+        cls.result = PithouseConverter().convert(_make_valid_pithouse())
 
     def test_convert_has_version(self):
-        data = _make_valid_pithouse()
-        result = self.converter.convert(data)
-        self.assertEqual(result["FoxblatPresetVersion"], "1")
+        self.assertEqual(self.result["FoxblatPresetVersion"], "1")
 
     def test_convert_has_base_and_main(self):
-        data = _make_valid_pithouse()
-        result = self.converter.convert(data)
-        self.assertIn("base", result)
-        self.assertIn("main", result)
-
-    def test_base_ffb_strength_scaled(self):
-        data = _make_valid_pithouse()
-        result = self.converter.convert(data)
-        # ffb-strength = value * 10
-        self.assertEqual(result["base"]["ffb-strength"], 800)
-
-    def test_base_max_angle(self):
-        data = _make_valid_pithouse()
-        result = self.converter.convert(data)
-        self.assertEqual(result["base"]["max-angle"], 900)
-
-    def test_base_protection_bool(self):
-        data = _make_valid_pithouse()
-        result = self.converter.convert(data)
-        self.assertEqual(result["base"]["protection"], 1)
-
-    def test_base_ffb_reverse_false(self):
-        data = _make_valid_pithouse()
-        result = self.converter.convert(data)
-        self.assertEqual(result["base"]["ffb-reverse"], 0)
-
-    def test_base_mechanical_values_scaled(self):
-        data = _make_valid_pithouse()
-        result = self.converter.convert(data)
-        # damper = mechanicalDamper * 10
-        self.assertEqual(result["base"]["damper"], 30)
-        self.assertEqual(result["base"]["friction"], 20)
-        self.assertEqual(result["base"]["inertia"], 40)
-        self.assertEqual(result["base"]["spring"], 10)
-        self.assertEqual(result["base"]["speed"], 50)
-
-    def test_base_equalizer(self):
-        data = _make_valid_pithouse()
-        result = self.converter.convert(data)
-        self.assertEqual(result["base"]["equalizer1"], 55)
-        self.assertEqual(result["base"]["equalizer2"], 60)
+        self.assertIn("base", self.result)
+        self.assertIn("main", self.result)
+
+    def test_conversion_fields(self):
+        cases = [
+            # ffb-strength = value * 10
+            ("base", "ffb-strength", 800),
+            ("base", "max-angle", 900),
+            ("base", "protection", 1),
+            ("base", "ffb-reverse", 0),
+            # mechanical values = value * 10
+            ("base", "damper", 30),
+            ("base", "friction", 20),
+            ("base", "inertia", 40),
+            ("base", "spring", 10),
+            ("base", "speed", 50),
+            ("base", "equalizer1", 55),
+            ("base", "equalizer2", 60),
+            ("main", "set-damper-gain", min(round(2.55 * 50), 255)),
+            ("main", "set-interpolation", 1),
+        ]
+        for section, field, expected in cases:
+            with self.subTest(field=f"{section}.{field}"):
+                self.assertEqual(self.result[section][field], expected)
 
     def test_main_gains_clamped(self):
         data = _make_valid_pithouse()
         data["deviceParams"]["setGameDampingValue"] = 100
-        result = self.converter.convert(data)
+        result = PithouseConverter().convert(data)
         # 2.55 * 100 = 255, capped at 255
         self.assertEqual(result["main"]["set-damper-gain"], 255)
 
-    def test_main_gains_scaled(self):
-        data = _make_valid_pithouse()
-        data["deviceParams"]["setGameDampingValue"] = 50
-        result = self.converter.convert(data)
-        self.assertEqual(result["main"]["set-damper-gain"], min(round(2.55 * 50), 255))
-
-    def test_main_interpolation(self):
-        data = _make_valid_pithouse()
-        result = self.converter.convert(data)
-        self.assertEqual(result["main"]["set-interpolation"], 1)
-
 
 class TestFFBCurveDecode(unittest.TestCase):
     """Test FFB curve decoding."""
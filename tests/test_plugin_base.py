@@ -17,7 +17,17 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # Set env var before importing foxblat modules to avoid KeyError in panels/__init__.py
 os.environ.setdefault("FOXBLAT_FLATPAK_EDITION", "false")
 
-from foxblat.plugin_base import PluginContext, PluginDeviceInfo
+from foxblat.plugin_base import PluginContext, PluginDeviceInfo, PluginPanel
+
+
+class _NoInitPanel(PluginPanel):
+    """Concrete PluginPanel that skips SettingsPanel.__init__ and its GTK setup."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def prepare_ui(self):
+        pass
 
 
 class TestPluginContext(unittest.TestCase):
@@ -54,26 +64,9 @@ class TestPluginDeviceInfo(unittest.TestCase):
 class TestPluginPanel(unittest.TestCase):
     """Test cases for PluginPanel with mocked GTK dependencies.
 
-    We patch SettingsPanel.__init__ to avoid GTK initialization.
+    Panels are built from _NoInitPanel to avoid GTK initialization.
     """
 
-    @classmethod
-    def setUpClass(cls):
-        # Patch SettingsPanel.__init__ to be a no-op for all tests in this class
-        cls._patcher = patch(
-            "foxblat.plugin_base.SettingsPanel.__init__",
-            lambda self, *a, **kw: None
-        )
-        cls._patcher.start()
-
-        # Now import PluginPanel (SettingsPanel.__init__ is already patched)
-        from foxblat.plugin_base import PluginPanel
-        cls.PluginPanel = PluginPanel
-
-    @classmethod
-    def tearDownClass(cls):
-        cls._patcher.stop()
-
     def _make_panel(self, title="Test Panel"):
         """Create a PluginPanel subclass instance with mocked context."""
         settings_handler = MagicMock()
@@ -85,12 +78,7 @@ class TestPluginPanel(unittest.TestCase):
             config_path="/config"
         )
 
-        # Create a concrete subclass since PluginPanel is abstract
-        class ConcretePanel(self.PluginPanel):
-            def prepare_ui(self):
-                pass
-
-        panel = ConcretePanel.__new__(ConcretePanel)
+        panel = _NoInitPanel()
         panel._context = ctx
         panel._connected_devices = {}
         return panel
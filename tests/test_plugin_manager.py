@@ -11,25 +11,27 @@ import unittest
 import sys
 import os
 import json
+import re
 import tempfile
 import shutil
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, PropertyMock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from foxblat.plugin_manager import PluginMatcher, LoadedPlugin, PluginManager
+from foxblat.plugin_manager import PluginMatcher, PluginMetadata, LoadedPlugin, PluginManager
+from tests.helpers import TempRootTestCase
 from foxblat.plugin_base import PluginPanel, PluginContext, PluginDeviceInfo
 
 
+class _Stub:
+    """Placeholder for handlers the plugin manager only passes along."""
+
+
 def _make_mock_device(name="Test Device", vendor=0x04b0, product=0x5750, path="/dev/input/event0"):
-    """Create a mock evdev InputDevice."""
-    device = MagicMock()
-    device.name = name
-    device.path = path
-    device.info = MagicMock()
-    device.info.vendor = vendor
-    device.info.product = product
-    return device
+    """Create a stand-in for an evdev InputDevice."""
+    return SimpleNamespace(name=name, path=path,
+                           info=SimpleNamespace(vendor=vendor, product=product))
 
 
 class TestPluginMatcher(unittest.TestCase):
@@ -82,6 +84,39 @@ class TestPluginMatcher(unittest.TestCase):
         device = _make_mock_device(name="GX-100 Shifter", vendor=0x0000, product=0x0000)
         self.assertTrue(matcher.matches(device))
 
+    def test_multiple_name_patterns(self):
+        metadata = {"devices": [
+            {"name_pattern": "(GX)-100"},
+            {"name_pattern": "^Shifter (\\d)-\\1$"},
+        ]}
+        matcher = PluginMatcher("test", metadata)
+        self.assertTrue(matcher.matches(_make_mock_device(name="gx-100 v2")))
+        self.assertTrue(matcher.matches(_make_mock_device(name="Shifter 2-2")))
+        self.assertFalse(matcher.matches(_make_mock_device(name="Shifter 2-3")))
+
+    def test_multiple_name_patterns_combined(self):
+        metadata = {"devices": [{"name_pattern": "GX-100"}, {"name_pattern": "Shifter"}]}
+        matcher = PluginMatcher("test", metadata)
+        self.assertEqual(len(matcher._name_rules), 1)
+        self.assertTrue(matcher.matches(_make_mock_device(name="My shifter")))
+        self.assertFalse(matcher.matches(_make_mock_device(name="Pedals")))
+
+    def test_matches_info(self):
+        metadata = {"devices": [
+            {"vendor_id": "0x04b0", "product_id": "0x5750"},
+            {"name_pattern": "GX-100"},
+        ]}
+        matcher = PluginMatcher("test", metadata)
+        self.assertTrue(matcher.matches_info(PluginDeviceInfo("Other", 0x04b0, 0x5750, "/dev/input/event0")))
+        self.assertTrue(matcher.matches_info(PluginDeviceInfo("GX-100 Shifter", 0, 0, "/dev/input/event1")))
+        self.assertFalse(matcher.matches_info(PluginDeviceInfo("Other", 0, 0, "/dev/input/event2")))
+
+    def test_identical_patterns_share_compiled_regex(self):
+        metadata = {"devices": [{"name_pattern": "Shared Device"}]}
+        first = PluginMatcher("first", metadata)
+        second = PluginMatcher("second", metadata)
+        self.assertIs(first._name_rules[0], second._name_rules[0])
+
     def test_empty_devices_list(self):
         metadata = {"devices": []}
         matcher = PluginMatcher("test", metadata)
@@ -94,6 +129,50 @@ class TestPluginMatcher(unittest.TestCase):
         device = _make_mock_device()
         self.assertFalse(matcher.matches(device))
 
+    def test_vid_pid_out_of_range_raises_on_construction(self):
+        metadata = {"devices": [{"vendor_id": "0x10000", "product_id": "0x0001"}]}
+        with self.assertRaises(ValueError):
+            PluginMatcher("test", metadata)
+
+    def test_invalid_name_pattern_raises_on_construction(self):
+        metadata = {"devices": [{"name_pattern": "GX-100("}]}
+        with self.assertRaises(re.error):
+            PluginMatcher("test", metadata)
+
+    def test_non_integer_vid_pid_raises_value_error(self):
+        for vid, pid in ((1200.0, 1), (True, 1)):
+            with self.subTest(vid=vid, pid=pid), self.assertRaises(ValueError):
+                PluginMatcher("test", {"devices": [{"vendor_id": vid, "product_id": pid}]})
+
+    def test_non_object_rule_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            PluginMatcher("test", {"devices": ["0x04b0"]})
+
+    def test_non_string_name_pattern_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            PluginMatcher("test", {"devices": [{"name_pattern": 5}]})
+
+
+class TestPluginMetadata(unittest.TestCase):
+    """Test cases for the PluginMetadata class."""
+
+    def test_from_dict(self):
+        metadata = PluginMetadata.from_dict({
+            "name": "GX-100 Shifter",
+            "panel_class": "GX100Panel",
+            "panel_title": "GX-100",
+            "devices": [{"vendor_id": "0x04b0", "product_id": "0x5750"}],
+        })
+        self.assertEqual(metadata.name, "GX-100 Shifter")
+        self.assertEqual(metadata.panel_title, "GX-100")
+        self.assertEqual(metadata.devices, ({"vendor_id": "0x04b0", "product_id": "0x5750"},))
+        self.assertIsNone(metadata.version)
+
+    def test_frozen(self):
+        metadata = PluginMetadata(name="Test", panel_class="TestPanel", devices=())
+        with self.assertRaises(AttributeError):
+            metadata.name = "changed"
+
 
 class TestLoadedPlugin(unittest.TestCase):
     """Test cases for the LoadedPlugin data class."""
@@ -101,7 +180,7 @@ class TestLoadedPlugin(unittest.TestCase):
     def test_construction(self):
         lp = LoadedPlugin(
             name="test-plugin",
-            metadata={"name": "Test"},
+            metadata=PluginMetadata(name="Test", panel_class="TestPanel", devices=()),
             module=MagicMock(),
             panel_class=MagicMock(),
             matcher=MagicMock(),
@@ -112,23 +191,13 @@ class TestLoadedPlugin(unittest.TestCase):
         self.assertEqual(lp.connected_devices, [])
 
 
-class TestPluginManagerLoadPlugin(unittest.TestCase):
-    """Test plugin loading with temporary directories."""
+class _PluginDirTestCase(TempRootTestCase):
+    """Provides a plugins directory per test and a helper to populate it."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        super().setUp()
         self.plugins_dir = os.path.join(self.tmpdir, "plugins")
-        os.makedirs(self.plugins_dir)
-
-        self.hid_handler = MagicMock()
-        self.settings_handler = MagicMock()
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir)
-
-    def _make_manager(self):
-        manager = PluginManager(self.tmpdir, self.hid_handler, self.settings_handler)
-        return manager
+        os.mkdir(self.plugins_dir)
 
     def _create_plugin_dir(self, name, metadata=None, init_content=None, create_init=True):
         """Create a plugin directory with optional files."""
@@ -147,6 +216,19 @@ class TestPluginManagerLoadPlugin(unittest.TestCase):
 
         return plugin_dir
 
+
+class TestPluginManagerLoadPlugin(_PluginDirTestCase):
+    """Test plugin loading with temporary directories."""
+
+    def setUp(self):
+        super().setUp()
+        self.hid_handler = _Stub()
+        self.settings_handler = _Stub()
+
+    def _make_manager(self):
+        manager = PluginManager(self.tmpdir, self.hid_handler, self.settings_handler)
+        return manager
+
     def test_load_plugin_missing_json(self):
         manager = self._make_manager()
         plugin_dir = self._create_plugin_dir("broken", create_init=True)
@@ -186,6 +268,23 @@ class TestPluginManagerLoadPlugin(unittest.TestCase):
         result = manager._load_plugin("incomplete2", plugin_dir)
         self.assertFalse(result)
 
+    def test_load_plugin_devices_not_list(self):
+        manager = self._make_manager()
+        plugin_dir = self._create_plugin_dir("baddevices",
+            metadata={"name": "Test", "panel_class": "TestPanel", "devices": "0x1234"})
+        result = manager._load_plugin("baddevices", plugin_dir)
+        self.assertFalse(result)
+
+    def test_load_plugin_malformed_device_rule(self):
+        manager = self._make_manager()
+        errors = []
+        manager.subscribe("plugin-load-error", lambda name, msg: errors.append(name))
+        plugin_dir = self._create_plugin_dir("badrule",
+            metadata={"name": "Test", "panel_class": "TestPanel", "devices": ["0x04b0"]})
+        result = manager._load_plugin("badrule", plugin_dir)
+        self.assertFalse(result)
+        self.assertEqual(errors, ["badrule"])
+
     def test_load_plugin_class_not_found_in_module(self):
         manager = self._make_manager()
         plugin_dir = self._create_plugin_dir("noclass",
@@ -224,27 +323,29 @@ class TestPluginManagerLoadPlugin(unittest.TestCase):
         self.assertTrue(result)
         self.assertIn("valid", manager._plugins)
         self.assertEqual(manager._plugins["valid"].name, "valid")
+        self.assertEqual(manager._plugins["valid"].metadata.name, "Valid Plugin")
+        self.assertEqual(manager._plugins["valid"].metadata.panel_class, "TestPanel")
 
+    def test_failed_import_removed_from_sys_modules(self):
+        manager = self._make_manager()
+        plugin_dir = self._create_plugin_dir("raises",
+            metadata={"name": "Test", "panel_class": "TestPanel", "devices": []},
+            init_content="raise RuntimeError('boom')\n")
+        self.assertFalse(manager._load_plugin("raises", plugin_dir))
+        self.assertNotIn("foxblat_plugin_raises", sys.modules)
 
-class TestPluginManagerDiscovery(unittest.TestCase):
-    """Test plugin discovery from directory scanning."""
-
-    def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.plugins_dir = os.path.join(self.tmpdir, "plugins")
-        os.makedirs(self.plugins_dir)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir)
+class TestPluginManagerDiscovery(_PluginDirTestCase):
+    """Test plugin discovery from directory scanning."""
 
     def test_ensure_plugins_directory_creates_dir(self):
         new_dir = os.path.join(self.tmpdir, "new_config")
-        manager = PluginManager(new_dir, MagicMock(), MagicMock())
+        manager = PluginManager(new_dir, _Stub(), _Stub())
         manager._ensure_plugins_directory()
         self.assertTrue(os.path.isdir(os.path.join(new_dir, "plugins")))
 
     def test_discover_empty_directory(self):
-        manager = PluginManager(self.tmpdir, MagicMock(), MagicMock())
+        manager = PluginManager(self.tmpdir, _Stub(), _Stub())
         manager._discover_plugins()
         self.assertEqual(len(manager._plugins), 0)
 
@@ -252,17 +353,115 @@ class TestPluginManagerDiscovery(unittest.TestCase):
         # Create a file (not a directory) in plugins/
         with open(os.path.join(self.plugins_dir, "not-a-plugin.txt"), "w") as f:
             f.write("hello")
-        manager = PluginManager(self.tmpdir, MagicMock(), MagicMock())
+        manager = PluginManager(self.tmpdir, _Stub(), _Stub())
         manager._discover_plugins()
         self.assertEqual(len(manager._plugins), 0)
 
 
+    def test_discover_follows_symlinked_plugin_dirs(self):
+        target = os.path.join(self.tmpdir, "elsewhere")
+        os.makedirs(target)
+        os.symlink(target, os.path.join(self.plugins_dir, "linked"))
+
+        manager = PluginManager(self.tmpdir, _Stub(), _Stub())
+        errors = []
+        manager.subscribe("plugin-load-error", lambda name, msg: errors.append(name))
+        manager._discover_plugins()
+        # The linked directory is visited (and rejected for missing plugin.json)
+        self.assertEqual(errors, ["linked"])
+
+    def test_discover_loads_multiple_plugins(self):
+        init_content = (
+            "from foxblat.plugin_base import PluginPanel\n"
+            "class TestPanel(PluginPanel):\n"
+            "    def prepare_ui(self):\n"
+            "        pass\n"
+        )
+        for name in ("first", "second", "third"):
+            self._create_plugin_dir(name,
+                metadata={"name": name, "panel_class": "TestPanel", "devices": []},
+                init_content=init_content)
+
+        broken_dir = self._create_plugin_dir("broken")
+        with open(os.path.join(broken_dir, "plugin.json"), "w") as f:
+            f.write("{invalid json")
+
+        manager = PluginManager(self.tmpdir, _Stub(), _Stub())
+        errors = []
+        manager.subscribe("plugin-load-error", lambda name, msg: errors.append(name))
+        with patch("foxblat.plugin_manager._json_loads", wraps=json.loads) as loads:
+            manager._discover_plugins()
+
+        self.assertEqual(set(manager._plugins), {"first", "second", "third"})
+        self.assertEqual(errors, ["broken"])
+        # Each plugin.json, including the broken one, is parsed exactly once
+        self.assertEqual(loads.call_count, 4)
+        self.assertEqual(manager._prefetched, {})
+
+    def test_read_metadata_uses_cache_when_unchanged(self):
+        plugin_dir = self._create_plugin_dir("cached", metadata={"name": "Cached"})
+        metadata_file = os.path.join(plugin_dir, "plugin.json")
+
+        manager = PluginManager(self.tmpdir, _Stub(), _Stub())
+        self.assertEqual(manager._read_metadata(metadata_file), {"name": "Cached"})
+
+        # A cache hit returns the stored copy without reading the file
+        manager._metadata_cache[os.path.abspath(metadata_file)][2] = {"name": "From cache"}
+        self.assertEqual(manager._read_metadata(metadata_file), {"name": "From cache"})
+
+        # Changing the file invalidates the entry
+        with open(metadata_file, "w") as f:
+            json.dump({"name": "Changed file"}, f)
+        self.assertEqual(manager._read_metadata(metadata_file), {"name": "Changed file"})
+
+    def test_corrupt_metadata_cache_file_is_ignored(self):
+        plugin_dir = self._create_plugin_dir("cached", metadata={"name": "Cached"})
+        metadata_file = os.path.join(plugin_dir, "plugin.json")
+        with open(os.path.join(self.tmpdir, ".plugins.cache.json"), "w") as f:
+            f.write("{not json")
+
+        manager = PluginManager(self.tmpdir, _Stub(), _Stub())
+        manager._load_metadata_cache()
+        self.assertEqual(manager._metadata_cache, {})
+        self.assertEqual(manager._read_metadata(metadata_file), {"name": "Cached"})
+
+    def test_malformed_metadata_cache_entries_are_dropped(self):
+        plugin_dir = self._create_plugin_dir("cached", metadata={"name": "Cached"})
+        metadata_file = os.path.join(plugin_dir, "plugin.json")
+        key = os.path.abspath(metadata_file)
+        stat = os.stat(key)
+        good = [stat.st_mtime_ns, stat.st_size, {"name": "From cache"}]
+        with open(os.path.join(self.tmpdir, ".plugins.cache.json"), "w") as f:
+            json.dump({key: 0, "/short": [1, 2], "/wrong": ["a", 2, {}], "/good": good}, f)
+
+        manager = PluginManager(self.tmpdir, _Stub(), _Stub())
+        manager._load_metadata_cache()
+        self.assertEqual(manager._metadata_cache, {"/good": good})
+        self.assertTrue(manager._metadata_cache_dirty)
+        self.assertEqual(manager._read_metadata(metadata_file), {"name": "Cached"})
+
+    def test_discover_writes_and_prunes_metadata_cache(self):
+        plugin_dir = self._create_plugin_dir("cached", metadata={"name": "Cached"})
+
+        manager = PluginManager(self.tmpdir, _Stub(), _Stub())
+        manager._discover_plugins()
+        with open(manager._metadata_cache_path) as f:
+            cache = json.load(f)
+        self.assertEqual(len(cache), 1)
+
+        shutil.rmtree(plugin_dir)
+        manager._discover_plugins()
+        with open(manager._metadata_cache_path) as f:
+            cache = json.load(f)
+        self.assertEqual(cache, {})
+
+
 class TestPluginManagerDeviceHandling(unittest.TestCase):
     """Test device connect/disconnect handling."""
 
     def setUp(self):
         self.tmpdir = tempfile.mkdtemp()
-        self.manager = PluginManager(self.tmpdir, MagicMock(), MagicMock())
+        self.manager = PluginManager(self.tmpdir, _Stub(), _Stub())
         self.manager._button_callback = MagicMock()
 
     def tearDown(self):
@@ -273,7 +472,7 @@ class TestPluginManagerDeviceHandling(unittest.TestCase):
         matcher = PluginMatcher(name, {"devices": [{"vendor_id": vid, "product_id": pid}]})
         plugin = LoadedPlugin(
             name=name,
-            metadata={"name": name, "panel_class": "FakePanel", "panel_title": name, "devices": []},
+            metadata=PluginMetadata(name=name, panel_class="FakePanel", devices=(), panel_title=name),
             module=MagicMock(),
             panel_class=MagicMock(),
             matcher=matcher,
@@ -292,6 +491,43 @@ class TestPluginManagerDeviceHandling(unittest.TestCase):
         self.assertEqual(len(plugin.connected_devices), 1)
         self.assertEqual(plugin.connected_devices[0].name, "Test Device")
 
+    def test_handle_device_connected_defers_panel_creation(self):
+        plugin = self._add_loaded_plugin()
+        getters = []
+        self.manager.subscribe("plugin-panels-updated", lambda panels: getters.extend(panels.values()))
+
+        self.manager._handle_device_connected(_make_mock_device(vendor=0x04b0, product=0x5750))
+        self.manager._flush_pending_panels()
+        self.assertIsNone(plugin.panel_instance)
+        self.assertEqual(len(getters), 1)
+
+        panel = getters[0]()
+        self.assertIs(panel, plugin.panel_instance)
+        plugin.panel_class.assert_called_once()
+        panel.on_device_connected.assert_called_once_with(plugin.connected_devices[0])
+
+        # Later requests reuse the same panel
+        self.assertIs(getters[0](), panel)
+        plugin.panel_class.assert_called_once()
+
+    def test_panels_available_batched_per_flush(self):
+        self._add_loaded_plugin("a")
+        self._add_loaded_plugin("b")
+        batches = []
+        self.manager.subscribe("plugin-panels-updated", batches.append)
+
+        self.manager._handle_device_connected(_make_mock_device(path="/dev/input/event0"))
+        self.manager._handle_device_connected(_make_mock_device(path="/dev/input/event1"))
+        self.assertEqual(batches, [])
+
+        self.manager._flush_pending_panels()
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(set(batches[0]), {"a", "b"})
+
+        # Nothing pending, nothing dispatched
+        self.manager._flush_pending_panels()
+        self.assertEqual(len(batches), 1)
+
     def test_handle_device_connected_no_match(self):
         plugin = self._add_loaded_plugin()
         device = _make_mock_device(vendor=0xFFFF, product=0xFFFF)
@@ -302,7 +538,7 @@ class TestPluginManagerDeviceHandling(unittest.TestCase):
     def test_handle_device_disconnected(self):
         plugin = self._add_loaded_plugin()
         device_info = PluginDeviceInfo("Test", 0x04b0, 0x5750, "/dev/input/event0")
-        plugin.connected_devices.append(device_info)
+        self.manager._add_connected_device(plugin, device_info)
         plugin.panel_instance = MagicMock()
 
         self.manager._handle_device_disconnected("/dev/input/event0")
@@ -313,13 +549,26 @@ class TestPluginManagerDeviceHandling(unittest.TestCase):
     def test_handle_device_disconnected_hides_panel_when_no_devices(self):
         plugin = self._add_loaded_plugin()
         device_info = PluginDeviceInfo("Test", 0x04b0, 0x5750, "/dev/input/event0")
-        plugin.connected_devices.append(device_info)
+        self.manager._add_connected_device(plugin, device_info)
         plugin.panel_instance = MagicMock()
 
         self.manager._handle_device_disconnected("/dev/input/event0")
 
         plugin.panel_instance.active.assert_called_once_with(-1)
 
+    def test_handle_device_disconnected_multiple_plugins(self):
+        plugin_a = self._add_loaded_plugin("a")
+        plugin_b = self._add_loaded_plugin("b")
+        device = _make_mock_device(vendor=0x04b0, product=0x5750)
+        self.manager._handle_device_connected(device)
+        self.assertEqual(len(plugin_a.connected_devices), 1)
+        self.assertEqual(len(plugin_b.connected_devices), 1)
+
+        self.manager._handle_device_disconnected(device.path)
+        self.assertEqual(plugin_a.connected_devices, [])
+        self.assertEqual(plugin_b.connected_devices, [])
+        self.assertNotIn(device.path, self.manager._path_index)
+
     def test_handle_device_disconnected_unknown_path(self):
         plugin = self._add_loaded_plugin()
         plugin.panel_instance = MagicMock()
@@ -333,7 +582,7 @@ class TestPluginManagerPresets(unittest.TestCase):
 
     def setUp(self):
         self.tmpdir = tempfile.mkdtemp()
-        self.manager = PluginManager(self.tmpdir, MagicMock(), MagicMock())
+        self.manager = PluginManager(self.tmpdir, _Stub(), _Stub())
 
     def tearDown(self):
         shutil.rmtree(self.tmpdir)
@@ -341,7 +590,7 @@ class TestPluginManagerPresets(unittest.TestCase):
     def _add_active_plugin(self, name="test", preset_name="test-device"):
         plugin = LoadedPlugin(
             name=name,
-            metadata={"name": name, "panel_class": "FakePanel", "devices": []},
+            metadata=PluginMetadata(name=name, panel_class="FakePanel", devices=()),
             module=MagicMock(),
             panel_class=MagicMock(),
             matcher=MagicMock(),
@@ -371,6 +620,20 @@ class TestPluginManagerPresets(unittest.TestCase):
         result = self.manager.get_active_plugins()
         self.assertEqual(len(result), 0)
 
+    def test_get_active_plugins_cached_until_change(self):
+        plugin, panel = self._add_active_plugin("p1", "device-1")
+        self.assertIn("device-1", self.manager.get_active_plugins())
+
+        # Unchanged state is served from the cache
+        panel.preset_device_name = "renamed"
+        self.assertIn("device-1", self.manager.get_active_plugins())
+
+        # Disconnecting the device invalidates it
+        device_info = PluginDeviceInfo("Test", 1, 2, "/dev/input/event0")
+        self.manager._add_connected_device(plugin, device_info)
+        self.manager._handle_device_disconnected("/dev/input/event0")
+        self.assertIn("renamed", self.manager.get_active_plugins())
+
     def test_get_plugin_preset_settings(self):
         self._add_active_plugin("p1", "my-device")
         result = self.manager.get_plugin_preset_settings("my-device")
@@ -410,9 +673,9 @@ class TestPluginManagerEvents(unittest.TestCase):
     def test_events_registered(self):
         tmpdir = tempfile.mkdtemp()
         try:
-            manager = PluginManager(tmpdir, MagicMock(), MagicMock())
+            manager = PluginManager(tmpdir, _Stub(), _Stub())
             events = manager.list_events()
-            self.assertIn("plugin-panel-available", events)
+            self.assertIn("plugin-panels-updated", events)
             self.assertIn("plugin-panel-unavailable", events)
             self.assertIn("plugin-load-error", events)
         finally:
@@ -421,7 +684,7 @@ class TestPluginManagerEvents(unittest.TestCase):
     def test_subscribe_to_load_error(self):
         tmpdir = tempfile.mkdtemp()
         try:
-            manager = PluginManager(tmpdir, MagicMock(), MagicMock())
+            manager = PluginManager(tmpdir, _Stub(), _Stub())
             errors = []
             manager.subscribe("plugin-load-error", lambda name, msg: errors.append((name, msg)))
 
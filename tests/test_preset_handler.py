@@ -10,142 +10,169 @@ Uses mocked connection_manager to avoid real device communication.
 import unittest
 import sys
 import os
-import tempfile
-import shutil
 import yaml
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 os.environ.setdefault("FOXBLAT_FLATPAK_EDITION", "false")
 
 from foxblat.preset_handler import MozaPresetHandler, MozaDevicePresetSettings
+from foxblat.yaml_io import YamlLoader, YamlDumper
+from tests.helpers import TempRootTestCase
 
+_PRESET_BYTES: dict[str, bytes] = {}
 
-class TestMozaPresetHandlerSetup(unittest.TestCase):
+
+def _preset_bytes(data: dict) -> bytes:
+    """Serialize a preset fixture once and reuse the bytes for identical payloads."""
+    key = repr(data)
+    if key not in _PRESET_BYTES:
+        _PRESET_BYTES[key] = yaml.dump(data, Dumper=YamlDumper).encode()
+    return _PRESET_BYTES[key]
+
+
+class _SharedCMTestCase(unittest.TestCase):
+    """Reuses one connection manager mock per class, reset before every test."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._cm_template = MagicMock()
+
+    def setUp(self):
+        super().setUp()
+        self.cm = self._cm_template
+        self.cm.reset_mock(return_value=True, side_effect=True)
+
+    def capture_written(self):
+        """Patch the YAML emitter so the dict handed to it lands in self._last_written.
+
+        The file is still written, so existence checks keep working, but tests
+        can assert on the saved data without parsing it back.
+        """
+        def record(data, *args, **kwargs):
+            self._last_written = data
+            return DEFAULT
+
+        self._last_written = None
+        return patch("foxblat.preset_handler.yaml.dump", wraps=yaml.dump, side_effect=record)
+
+
+class _SharedHandlerTestCase(_SharedCMTestCase):
+    """Reuses one handler per class for tests that only touch in-memory state."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.handler = MozaPresetHandler(cls._cm_template)
+
+    def setUp(self):
+        super().setUp()
+        self.handler.reset_settings()
+        self.handler._path = None
+        self.handler._name = None
+        self.handler._hpattern = {}
+        self.handler._stalks = {}
+        self.handler._plugin_settings = {}
+
+
+class TestMozaPresetHandlerSetup(_SharedHandlerTestCase):
     """Test basic preset handler setup."""
 
     def test_construction(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
+        handler = MozaPresetHandler(self.cm)
         self.assertIsNotNone(handler)
 
     def test_set_path(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.set_path("/tmp/test-presets")
-        self.assertEqual(handler._path, "/tmp/test-presets")
+        self.handler.set_path("/tmp/test-presets")
+        self.assertEqual(self.handler._path, "/tmp/test-presets")
 
     def test_set_path_expands_user(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.set_path("~/presets")
-        self.assertNotIn("~", handler._path)
+        self.handler.set_path("~/presets")
+        self.assertNotIn("~", self.handler._path)
 
     def test_set_name_adds_yml(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.set_name("my-preset")
-        self.assertEqual(handler._name, "my-preset.yml")
+        self.handler.set_name("my-preset")
+        self.assertEqual(self.handler._name, "my-preset.yml")
 
     def test_set_name_no_double_yml(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.set_name("my-preset.yml")
-        self.assertEqual(handler._name, "my-preset.yml")
+        self.handler.set_name("my-preset.yml")
+        self.assertEqual(self.handler._name, "my-preset.yml")
 
 
-class TestMozaPresetHandlerSettings(unittest.TestCase):
+class TestMozaPresetHandlerSettings(_SharedHandlerTestCase):
     """Test settings management."""
 
     def test_append_setting(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.append_setting("base-max-angle")
-        self.assertIn("base", handler._settings)
-        self.assertIn("max-angle", handler._settings["base"])
+        self.handler.append_setting("base-max-angle")
+        self.assertIn("base", self.handler._settings)
+        self.assertIn("max-angle", self.handler._settings["base"])
 
     def test_append_multiple_settings(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.append_setting("base-max-angle")
-        handler.append_setting("base-ffb-strength")
-        self.assertEqual(len(handler._settings["base"]), 2)
+        self.handler.append_setting("base-max-angle")
+        self.handler.append_setting("base-ffb-strength")
+        self.assertEqual(len(self.handler._settings["base"]), 2)
 
     def test_add_device_settings(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.add_device_settings("pedals")
-        self.assertIn("pedals", handler._settings)
-        self.assertTrue(len(handler._settings["pedals"]) > 0)
+        self.handler.add_device_settings("pedals")
+        self.assertIn("pedals", self.handler._settings)
+        self.assertTrue(len(self.handler._settings["pedals"]) > 0)
 
     def test_add_base_includes_main(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.add_device_settings("base")
-        self.assertIn("base", handler._settings)
-        self.assertIn("main", handler._settings)
+        self.handler.add_device_settings("base")
+        self.assertIn("base", self.handler._settings)
+        self.assertIn("main", self.handler._settings)
 
     def test_add_unknown_device_no_error(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.add_device_settings("nonexistent")
-        self.assertNotIn("nonexistent", handler._settings)
+        self.handler.add_device_settings("nonexistent")
+        self.assertNotIn("nonexistent", self.handler._settings)
 
     def test_reset_settings(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
-        handler.add_device_settings("pedals")
-        handler.reset_settings()
-        self.assertEqual(len(handler._settings), 0)
+        self.handler.add_device_settings("pedals")
+        self.handler.reset_settings()
+        self.assertEqual(len(self.handler._settings), 0)
 
 
-class TestMozaPresetHandlerHPatternStalks(unittest.TestCase):
+class TestMozaPresetHandlerHPatternStalks(_SharedHandlerTestCase):
     """Test H-pattern and stalks settings."""
 
     def test_set_get_hpattern(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
         settings = {"gear1": 100, "gear2": 200}
-        handler.set_hpattern_settings(settings)
-        self.assertEqual(handler.get_hpattern_settings(), settings)
+        self.handler.set_hpattern_settings(settings)
+        self.assertEqual(self.handler.get_hpattern_settings(), settings)
 
     def test_set_get_stalks(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
         settings = {"mode": "compat"}
-        handler.set_stalks_settings(settings)
-        self.assertEqual(handler.get_stalks_settings(), settings)
+        self.handler.set_stalks_settings(settings)
+        self.assertEqual(self.handler.get_stalks_settings(), settings)
 
 
-class TestMozaPresetHandlerPluginSettings(unittest.TestCase):
+class TestMozaPresetHandlerPluginSettings(_SharedHandlerTestCase):
     """Test plugin settings management."""
 
     def test_set_plugin_settings(self):
-        cm = MagicMock()
-        handler = MozaPresetHandler(cm)
         settings = {"gx-100": {"sensitivity": 80}}
-        handler.set_plugin_settings(settings)
-        self.assertEqual(handler._plugin_settings, settings)
+        self.handler.set_plugin_settings(settings)
+        self.assertEqual(self.handler._plugin_settings, settings)
 
 
-class TestMozaPresetHandlerFileOps(unittest.TestCase):
+class TestMozaPresetHandlerFileOps(_SharedCMTestCase, TempRootTestCase):
     """Test file-based preset operations."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.cm = MagicMock()
+        super().setUp()
         self.handler = MozaPresetHandler(self.cm)
         self.handler.set_path(self.tmpdir)
         self.handler.set_name("test-preset")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir)
-
     def _write_preset(self, data):
+        self._write_preset_bytes(_preset_bytes(data))
+
+    def _write_preset_bytes(self, raw):
         filepath = os.path.join(self.tmpdir, "test-preset.yml")
-        with open(filepath, "w") as f:
-            yaml.safe_dump(data, f)
+        with open(filepath, "wb") as f:
+            f.write(raw)
 
     def test_get_preset_data_no_file(self):
         result = self.handler._get_preset_data()
@@ -161,14 +188,33 @@ class TestMozaPresetHandlerFileOps(unittest.TestCase):
         filepath = os.path.join(self.tmpdir, "test-preset.yml")
         self.assertTrue(os.path.isfile(filepath))
 
+    def test_set_preset_data_streams_to_file(self):
+        with patch("foxblat.preset_handler.yaml.dump", wraps=yaml.dump) as dump:
+            self.handler._set_preset_data({"saved": True})
+        stream = dump.call_args.kwargs["stream"]
+        self.assertTrue(hasattr(stream, "write"))
+        filepath = os.path.join(self.tmpdir, "test-preset.yml")
+        with open(filepath, "rb") as f:
+            self.assertEqual(yaml.load(f, Loader=YamlLoader), {"saved": True})
+
     def test_set_preset_data_creates_directory(self):
         nested_path = os.path.join(self.tmpdir, "nested", "presets")
         self.handler.set_path(nested_path)
         self.handler._set_preset_data({"data": 1})
         self.assertTrue(os.path.isdir(nested_path))
 
+    def test_set_preset_data_existing_directory_skips_checks(self):
+        with patch("foxblat.preset_handler.os.path.isdir", wraps=os.path.isdir) as isdir, \
+                patch("foxblat.preset_handler.os.path.exists", wraps=os.path.exists) as exists, \
+                patch("foxblat.preset_handler.os.makedirs", wraps=os.makedirs) as makedirs:
+            self.handler._set_preset_data({"data": 1})
+        isdir.assert_not_called()
+        exists.assert_not_called()
+        makedirs.assert_not_called()
+        self.assertTrue(os.path.isfile(os.path.join(self.tmpdir, "test-preset.yml")))
+
     def test_linked_process_roundtrip(self):
-        self._write_preset({})
+        self._write_preset_bytes(b"{}\n")
         self.handler.set_linked_process("game.exe")
         result = self.handler.get_linked_process()
         self.assertEqual(result, "game.exe")
@@ -178,12 +224,12 @@ class TestMozaPresetHandlerFileOps(unittest.TestCase):
         self.assertEqual(result, "")
 
     def test_get_linked_process_no_key(self):
-        self._write_preset({"other": "data"})
+        self._write_preset_bytes(b"other: data\n")
         result = self.handler.get_linked_process()
         self.assertEqual(result, "")
 
     def test_linked_vehicle_roundtrip(self):
-        self._write_preset({})
+        self._write_preset_bytes(b"{}\n")
         self.handler.set_linked_vehicle("Ferrari 488")
         result = self.handler.get_linked_vehicle()
         self.assertEqual(result, "Ferrari 488")
@@ -193,7 +239,7 @@ class TestMozaPresetHandlerFileOps(unittest.TestCase):
         self.assertEqual(result, "")
 
     def test_get_linked_vehicle_no_key(self):
-        self._write_preset({"other": "data"})
+        self._write_preset_bytes(b"other: data\n")
         result = self.handler.get_linked_vehicle()
         self.assertEqual(result, "")
 
@@ -201,11 +247,11 @@ class TestMozaPresetHandlerFileOps(unittest.TestCase):
         self.assertFalse(self.handler.is_default())
 
     def test_is_default_false_when_not_set(self):
-        self._write_preset({"other": "data"})
+        self._write_preset_bytes(b"other: data\n")
         self.assertFalse(self.handler.is_default())
 
     def test_set_and_check_default(self):
-        self._write_preset({})
+        self._write_preset_bytes(b"{}\n")
         self.handler.set_default(True)
         self.assertTrue(self.handler.is_default())
 
@@ -216,24 +262,22 @@ class TestMozaPresetHandlerFileOps(unittest.TestCase):
 
     def test_copy_preset(self):
         self._write_preset({"key": "value", "base": {"angle": 900}})
-        self.handler.copy_preset("copy-preset")
+        with self.capture_written():
+            self.handler.copy_preset("copy-preset")
         copy_path = os.path.join(self.tmpdir, "copy-preset.yml")
         self.assertTrue(os.path.isfile(copy_path))
-        with open(copy_path) as f:
-            data = yaml.safe_load(f)
-        self.assertEqual(data["key"], "value")
+        self.assertEqual(self._last_written["key"], "value")
 
     def test_save_imported_preset(self):
         preset_data = {
             "FoxblatPresetVersion": "1",
             "base": {"max-angle": 900},
         }
-        self.handler.save_imported_preset(preset_data)
+        with self.capture_written():
+            self.handler.save_imported_preset(preset_data)
         filepath = os.path.join(self.tmpdir, "test-preset.yml")
         self.assertTrue(os.path.isfile(filepath))
-        with open(filepath) as f:
-            data = yaml.safe_load(f)
-        self.assertEqual(data["base"]["max-angle"], 900)
+        self.assertEqual(self._last_written["base"]["max-angle"], 900)
 
     def test_save_imported_preset_no_path(self):
         handler = MozaPresetHandler(self.cm)
@@ -251,7 +295,7 @@ class TestMozaPresetHandlerFileOps(unittest.TestCase):
         self.assertEqual(result["custom"]["mode"], "fast")
 
     def test_get_plugin_settings_no_plugins(self):
-        self._write_preset({"base": {"angle": 900}})
+        self._write_preset_bytes(b"base:\n  angle: 900\n")
         result = self.handler.get_plugin_settings()
         self.assertEqual(result, {})
 
@@ -260,19 +304,15 @@ class TestMozaPresetHandlerFileOps(unittest.TestCase):
         self.assertEqual(result, {})
 
 
-class TestMozaPresetHandlerSavePreset(unittest.TestCase):
+class TestMozaPresetHandlerSavePreset(_SharedCMTestCase, TempRootTestCase):
     """Test _save_preset with mocked connection manager."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.cm = MagicMock()
+        super().setUp()
         self.handler = MozaPresetHandler(self.cm)
         self.handler.set_path(self.tmpdir)
         self.handler.set_name("save-test")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir)
-
     def test_save_preset_no_path(self):
         handler = MozaPresetHandler(self.cm)
         # No path set — should not crash
@@ -281,72 +321,58 @@ class TestMozaPresetHandlerSavePreset(unittest.TestCase):
     def test_save_creates_version_key(self):
         self.cm.get_setting.return_value = 50
         self.handler.add_device_settings("pedals")
-        self.handler._save_preset()
-
-        filepath = os.path.join(self.tmpdir, "save-test.yml")
-        with open(filepath) as f:
-            data = yaml.safe_load(f)
+        with self.capture_written():
+            self.handler._save_preset()
+        data = self._last_written
         self.assertEqual(data["FoxblatPresetVersion"], "1")
 
     def test_save_reads_settings_from_cm(self):
         self.cm.get_setting.return_value = 42
         self.handler.append_setting("base-max-angle")
-        self.handler._save_preset()
-
-        filepath = os.path.join(self.tmpdir, "save-test.yml")
-        with open(filepath) as f:
-            data = yaml.safe_load(f)
+        with self.capture_written():
+            self.handler._save_preset()
+        data = self._last_written
         self.assertEqual(data["base"]["max-angle"], 42)
 
     def test_save_includes_plugin_settings(self):
         self.cm.get_setting.return_value = 50
         self.handler.set_plugin_settings({"my-plugin": {"volume": 80}})
-        self.handler._save_preset()
-
-        filepath = os.path.join(self.tmpdir, "save-test.yml")
-        with open(filepath) as f:
-            data = yaml.safe_load(f)
+        with self.capture_written():
+            self.handler._save_preset()
+        data = self._last_written
         self.assertEqual(data["plugin-my-plugin"]["volume"], 80)
 
     def test_save_includes_hpattern(self):
         self.cm.get_setting.return_value = 50
         self.handler.add_device_settings("hpattern")
         self.handler.set_hpattern_settings({"gear1": 100})
-        self.handler._save_preset()
-
-        filepath = os.path.join(self.tmpdir, "save-test.yml")
-        with open(filepath) as f:
-            data = yaml.safe_load(f)
+        with self.capture_written():
+            self.handler._save_preset()
+        data = self._last_written
         self.assertEqual(data["hpattern"]["gear1"], 100)
 
     def test_save_skips_none_values(self):
         self.cm.get_setting.return_value = None
         self.handler.append_setting("base-max-angle")
-        self.handler._save_preset()
-
-        filepath = os.path.join(self.tmpdir, "save-test.yml")
-        with open(filepath) as f:
-            data = yaml.safe_load(f)
+        with self.capture_written():
+            self.handler._save_preset()
+        data = self._last_written
         self.assertNotIn("max-angle", data.get("base", {}))
 
 
-class TestMozaPresetHandlerLoadPreset(unittest.TestCase):
+class TestMozaPresetHandlerLoadPreset(_SharedCMTestCase, TempRootTestCase):
     """Test _load_preset with mocked connection manager."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
-        self.cm = MagicMock()
+        super().setUp()
         self.handler = MozaPresetHandler(self.cm)
         self.handler.set_path(self.tmpdir)
         self.handler.set_name("load-test")
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir)
-
     def _write_preset(self, data):
         filepath = os.path.join(self.tmpdir, "load-test.yml")
-        with open(filepath, "w") as f:
-            yaml.safe_dump(data, f)
+        with open(filepath, "wb") as f:
+            f.write(_preset_bytes(data))
 
     def test_load_no_path(self):
         handler = MozaPresetHandler(self.cm)
@@ -365,8 +391,8 @@ class TestMozaPresetHandlerLoadPreset(unittest.TestCase):
         self.handler._load_preset(None, None)
 
         # set_setting should be called for each loaded setting
-        calls = [str(c) for c in self.cm.set_setting.call_args_list]
-        self.assertTrue(any("max-angle" in c for c in calls))
+        names = [c.args[1] for c in self.cm.set_setting.call_args_list]
+        self.assertIn("base-max-angle", names)
 
     def test_load_skips_none_values(self):
         self._write_preset({
@@ -414,8 +440,8 @@ class TestMozaPresetHandlerLoadPreset(unittest.TestCase):
         })
         self.cm.get_setting.return_value = 0
         self.handler._load_preset(None, None)
-        calls = [str(c) for c in self.cm.set_setting.call_args_list]
-        self.assertTrue(any("rpm-indicator-mode" in c for c in calls))
+        names = [c.args[1] for c in self.cm.set_setting.call_args_list]
+        self.assertIn("dash-rpm-indicator-mode", names)
 
 
 class TestMozaDevicePresetSettings(unittest.TestCase):
@@ -429,8 +455,9 @@ class TestMozaDevicePresetSettings(unittest.TestCase):
             self.assertIn(device, MozaDevicePresetSettings, f"Missing device: {device}")
 
     def test_all_settings_are_lists(self):
-        for device, settings in MozaDevicePresetSettings.items():
-            self.assertIsInstance(settings, list, f"{device} settings should be a list")
+        bad = [device for device, settings in MozaDevicePresetSettings.items()
+               if not isinstance(settings, list)]
+        self.assertFalse(bad, f"settings should be lists for: {bad}")
 
     def test_base_has_ffb_settings(self):
         base_settings = MozaDevicePresetSettings["base"]
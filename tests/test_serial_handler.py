@@ -16,42 +16,54 @@ from threading import Event
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from foxblat.serial_handler import SerialHandler, SERIAL_PAYLOAD_LENGTHS
 
+
+class _StubEvent:
+    """Minimal stand-in for multiprocessing.Event without mock bookkeeping."""
+    __slots__ = ("_set",)
+
+    def __init__(self):
+        self._set = False
+
+    def set(self):
+        self._set = True
+
+    def is_set(self):
+        return self._set
+
+    def clear(self):
+        self._set = False
+
+
+@patch.multiple("foxblat.serial_handler", Process=MagicMock(), Thread=MagicMock())
 class TestSerialHandlerWriteBytes(unittest.TestCase):
     """Test write_bytes queueing without constructing a full SerialHandler."""
 
-    @patch("foxblat.serial_handler.Process")
-    @patch("foxblat.serial_handler.Thread")
     @patch("foxblat.serial_handler.Queue")
     @patch("foxblat.serial_handler.Event")
-    def test_write_bytes_queues_message(self, MockEvent, MockQueue, MockThread, MockProcess):
+    def test_write_bytes_queues_message(self, MockEvent, MockQueue):
         import queue
         # Use stdlib queue.Queue so put/get/empty work without multiprocessing
         MockQueue.side_effect = lambda: queue.Queue()
-        MockEvent.side_effect = lambda: MagicMock()
-        from foxblat.serial_handler import SerialHandler
+        MockEvent.side_effect = _StubEvent
         handler = SerialHandler("/dev/null", 0xAA, "test")
         handler.write_bytes(b'\x01\x02\x03')
         self.assertFalse(handler._write_queue.empty())
         msg = handler._write_queue.get()
         self.assertEqual(msg, b'\x01\x02\x03')
 
-    @patch("foxblat.serial_handler.Process")
-    @patch("foxblat.serial_handler.Thread")
-    def test_write_bytes_none_ignored(self, MockThread, MockProcess):
-        from foxblat.serial_handler import SerialHandler
+    def test_write_bytes_none_ignored(self):
         handler = SerialHandler("/dev/null", 0xAA, "test")
         handler.write_bytes(None)
         self.assertTrue(handler._write_queue.empty())
 
 
+@patch.multiple("foxblat.serial_handler", Process=MagicMock(), Thread=MagicMock())
 class TestSerialHandlerStop(unittest.TestCase):
     """Test stop method."""
 
-    @patch("foxblat.serial_handler.Process")
-    @patch("foxblat.serial_handler.Thread")
-    def test_stop_sets_shutdown(self, MockThread, MockProcess):
-        from foxblat.serial_handler import SerialHandler
+    def test_stop_sets_shutdown(self):
         handler = SerialHandler("/dev/null", 0xAA, "test")
         handler.stop()
         self.assertTrue(handler._shutdown.is_set())
@@ -63,22 +75,15 @@ class TestSerialHandlerReadProtocol(unittest.TestCase):
 
     def test_payload_length_validation(self):
         """Valid payload lengths are 2-11."""
-        valid_lengths = list(range(2, 12))
-        for length in valid_lengths:
-            self.assertTrue(2 <= length <= 11)
-
-        invalid_lengths = [0, 1, 12, 100]
-        for length in invalid_lengths:
-            self.assertFalse(2 <= length <= 11)
+        self.assertEqual(SERIAL_PAYLOAD_LENGTHS, range(2, 12))
+        self.assertFalse(any(n in SERIAL_PAYLOAD_LENGTHS for n in (0, 1, 12, 100)))
 
 
+@patch.multiple("foxblat.serial_handler", Process=MagicMock(), Thread=MagicMock())
 class TestSerialHandlerSubscription(unittest.TestCase):
     """Test that SerialHandler inherits SimpleEventDispatcher."""
 
-    @patch("foxblat.serial_handler.Process")
-    @patch("foxblat.serial_handler.Thread")
-    def test_subscribe(self, MockThread, MockProcess):
-        from foxblat.serial_handler import SerialHandler
+    def test_subscribe(self):
         handler = SerialHandler("/dev/null", 0xAA, "test")
         results = []
         handler.subscribe(lambda data: results.append(data))
@@ -9,24 +9,20 @@ Tests YAML-based persistent settings storage.
 import unittest
 import sys
 import os
-import tempfile
-import shutil
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from foxblat.settings_handler import SettingsHandler
+from tests.helpers import TempRootTestCase
 
 
-class TestSettingsHandler(unittest.TestCase):
+class TestSettingsHandler(TempRootTestCase):
     """Test cases for SettingsHandler."""
 
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        super().setUp()
         self.handler = SettingsHandler(self.tmpdir)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir)
-
     def test_creates_directory(self):
         new_dir = os.path.join(self.tmpdir, "subdir", "config")
         handler = SettingsHandler(new_dir)
@@ -36,30 +32,22 @@ class TestSettingsHandler(unittest.TestCase):
         settings_file = os.path.join(self.tmpdir, "settings.yml")
         self.assertTrue(os.path.isfile(settings_file))
 
-    def test_write_and_read_string(self):
-        self.handler.write_setting("hello", "greeting")
-        self.assertEqual(self.handler.read_setting("greeting"), "hello")
-
-    def test_write_and_read_int(self):
-        self.handler.write_setting(42, "answer")
-        self.assertEqual(self.handler.read_setting("answer"), 42)
-
-    def test_write_and_read_float(self):
-        self.handler.write_setting(3.14, "pi")
-        self.assertAlmostEqual(self.handler.read_setting("pi"), 3.14)
-
-    def test_write_and_read_bool(self):
-        self.handler.write_setting(True, "flag")
-        self.assertTrue(self.handler.read_setting("flag"))
-
-    def test_write_and_read_list(self):
-        self.handler.write_setting([1, 2, 3], "numbers")
-        self.assertEqual(self.handler.read_setting("numbers"), [1, 2, 3])
-
-    def test_write_and_read_dict(self):
-        data = {"key": "value", "nested": {"a": 1}}
-        self.handler.write_setting(data, "config")
-        self.assertEqual(self.handler.read_setting("config"), data)
+    def test_roundtrip_value_types(self):
+        cases = [
+            ("hello", "greeting"),
+            (42, "answer"),
+            (3.14, "pi"),
+            (True, "flag"),
+            ([1, 2, 3], "numbers"),
+            ({"key": "value", "nested": {"a": 1}}, "config"),
+            ("日本語テスト", "unicode"),
+            ("", "empty"),
+            (None, "nullable"),
+        ]
+        for value, key in cases:
+            with self.subTest(key=key):
+                self.handler.write_setting(value, key)
+                self.assertEqual(self.handler.read_setting(key), value)
 
     def test_read_nonexistent_setting(self):
         self.assertIsNone(self.handler.read_setting("does-not-exist"))
@@ -99,18 +87,6 @@ class TestSettingsHandler(unittest.TestCase):
         handler2 = SettingsHandler(self.tmpdir)
         self.assertEqual(handler2.read_setting("data"), "persistent")
 
-    def test_write_none_value(self):
-        self.handler.write_setting(None, "nullable")
-        self.assertIsNone(self.handler.read_setting("nullable"))
-
-    def test_unicode_values(self):
-        self.handler.write_setting("日本語テスト", "unicode")
-        self.assertEqual(self.handler.read_setting("unicode"), "日本語テスト")
-
-    def test_empty_string_value(self):
-        self.handler.write_setting("", "empty")
-        self.assertEqual(self.handler.read_setting("empty"), "")
-
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -46,6 +46,10 @@ class TestSubscription(unittest.TestCase):
         sub.call(1, 2)
         self.assertEqual(results, [(1, 2)])
 
+    def test_no_instance_dict(self):
+        sub = Subscription(lambda: None)
+        self.assertFalse(hasattr(sub, "__dict__"))
+
     def test_call_custom_args(self):
         results = []
         sub = Subscription(lambda a, b: results.append((a, b)), "ignored")
@@ -95,6 +99,36 @@ class TestSubscriptionList(unittest.TestCase):
         sl.remove(sub)
         self.assertEqual(sl.count(), 0)
 
+    def test_remove_keeps_order_of_remaining(self):
+        results = []
+        sl = SubscriptionList()
+        sl.append(lambda v: results.append("a"))
+        sub = sl.append(lambda v: results.append("b"))
+        sl.append(lambda v: results.append("c"))
+        sl.remove(sub)
+        sl.call(0)
+        self.assertEqual(results, ["a", "c"])
+
+    def test_remove_during_call(self):
+        results = []
+        sl = SubscriptionList()
+        subs = []
+        subs.append(sl.append(lambda v: sl.remove(subs[1])))
+        subs.append(sl.append(lambda v: results.append(v)))
+        sl.call(1)
+        self.assertEqual(results, [1])
+        self.assertEqual(sl.count(), 1)
+
+    def test_single_time_keeps_insertion_order(self):
+        results = []
+        sl = SubscriptionList()
+        sl.append(lambda v: results.append("a"))
+        sl.append_single(lambda v: results.append("once"))
+        sl.append(lambda v: results.append("b"))
+        sl.call(0)
+        sl.call(0)
+        self.assertEqual(results, ["a", "once", "b", "a", "b"])
+
     def test_remove_single_time_subscription(self):
         sl = SubscriptionList()
         sub = sl.append_single(lambda v: None)
@@ -102,6 +136,15 @@ class TestSubscriptionList(unittest.TestCase):
         sl.remove(sub)
         self.assertEqual(sl.count(), 0)
 
+    def test_subscribe_during_call_waits_for_next_call(self):
+        results = []
+        sl = SubscriptionList()
+        sl.append(lambda v: sl.append(lambda v: results.append(("late", v))))
+        sl.call(1)
+        self.assertEqual(results, [])
+        sl.call(2)
+        self.assertEqual(results, [("late", 2)])
+
     def test_clear(self):
         sl = SubscriptionList()
         sl.append(lambda v: None)
@@ -144,6 +187,22 @@ class TestEventDispatcher(unittest.TestCase):
         self.assertIn("b", self.ed.events)
         self.assertIn("c", self.ed.events)
 
+    def test_register_events_bulk_keeps_existing(self):
+        results = []
+        self.ed._register_event("a")
+        self.ed.subscribe("a", lambda v: results.append(v))
+        self.ed._register_events("a", "b")
+        self.assertEqual(self.ed.list_events(), ["a", "b"])
+        self.ed._dispatch("a", 1)
+        self.assertEqual(results, [1])
+
+    def test_registered_names_are_interned(self):
+        name = "".join(["runtime", "-", "event"])
+        self.ed._register_event(name)
+        self.ed._register_events("".join(["bulk", "-", "event"]))
+        for registered in self.ed.list_events():
+            self.assertIs(registered, sys.intern(registered))
+
     def test_deregister_event(self):
         self.ed._register_event("removable")
         self.assertTrue(self.ed._deregister_event("removable"))
@@ -230,6 +289,12 @@ class TestSimpleEventDispatcher(unittest.TestCase):
         sed._dispatch(5)
         self.assertEqual(results, [("a", 5), ("b", 5)])
 
+    def test_subscription_count(self):
+        sed = SimpleEventDispatcher()
+        self.assertEqual(sed._subscription_count(), 0)
+        sed.subscribe(lambda v: None)
+        self.assertEqual(sed._subscription_count(), 1)
+
     def test_clear_subscriptions(self):
         results = []
         sed = SimpleEventDispatcher()
@@ -296,6 +361,26 @@ class TestBlockingValue(unittest.TestCase):
         result = bv.get_value(timeout=0.01)
         self.assertIsNone(result)
 
+    def test_get_consumes_value(self):
+        bv = BlockingValue()
+        bv.set_value(42)
+        self.assertEqual(bv.get_value(timeout=1), 42)
+        self.assertIsNone(bv.get_value(timeout=0.01))
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(BlockingValue(), "__dict__"))
+
+    def test_get_value_no_clear_blocks_until_set(self):
+        bv = BlockingValue()
+
+        def setter():
+            sleep(0.05)
+            bv.set_value(7)
+
+        Thread(target=setter, daemon=True).start()
+        self.assertEqual(bv.get_value_no_clear(timeout=2), 7)
+        self.assertEqual(bv.get_value(timeout=0.01), 7)
+
     def test_get_value_no_clear(self):
         bv = BlockingValue()
         bv.set_value(10)
@@ -10,6 +10,7 @@ These tests require GTK to be available and will be skipped otherwise.
 import unittest
 import sys
 import os
+from unittest.mock import patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
@@ -80,6 +81,17 @@ class TestFoxblatRow(unittest.TestCase):
         row.set_expression("*2")
         self.assertEqual(row._expression, "*2")
 
+    def test_compound_expression_matches_eval(self):
+        row = self.FoxblatRow()
+        for expr in ("*2.55", "*22+56", "*-1 +20", "/(400/9) - 2.25 + 1"):
+            with self.subTest(expr=expr):
+                row.set_expression(expr)
+                row.set_reverse_expression(expr)
+                value = 7
+                expected = eval("value" + expr)
+                self.assertEqual(row._expression_fn(value), expected)
+                self.assertEqual(row._reverse_expression_fn(value), expected)
+
     def test_set_reverse_expression(self):
         row = self.FoxblatRow()
         row.set_reverse_expression("/2")
@@ -112,6 +124,14 @@ class TestFoxblatRow(unittest.TestCase):
         row._notify()
         self.assertEqual(results, [0])  # default get_value() returns 0
 
+    def test_notify_without_subscribers_skips_get_value(self):
+        row = self.FoxblatRow()
+        calls = []
+        row.get_value = lambda: calls.append(1) or 0
+        row._notify()
+        self.assertEqual(calls, [])
+        self.assertTrue(row.cooldown())
+
     def test_disable_cooldown(self):
         row = self.FoxblatRow()
         row.disable_cooldown()
@@ -184,6 +204,29 @@ class TestFoxblatSliderRow(unittest.TestCase):
         row.set_value_directly(50)
         self.assertEqual(results, [50])
 
+    def test_get_value_tracks_changes(self):
+        row = self.SliderRow(title="Test", range_start=0, range_end=100, value=10)
+        self.assertEqual(row.get_value(), 10)
+        row.set_value_directly(30)
+        self.assertEqual(row.get_value(), 30)
+        row.set_expression("*2")
+        self.assertEqual(row.get_value(), 60)
+        row._slider.set_value(40)
+        self.assertEqual(row.get_value(), 80)
+
+    def test_change_during_get_value_is_not_cached(self):
+        row = self.SliderRow(title="Test", range_start=0, range_end=100, value=10)
+        expression_fn = row._expression_fn
+
+        def change_mid_read(value):
+            row._expression_fn = expression_fn
+            row._slider.set_value(20)
+            return expression_fn(value)
+
+        row._expression_fn = change_mid_read
+        self.assertEqual(row.get_value(), 10)
+        self.assertEqual(row.get_value(), 20)
+
     def test_slider_marks(self):
         # Should not raise
         row = self.SliderRow(title="Test", range_start=0, range_end=100, value=0)
@@ -311,6 +354,37 @@ class TestFoxblatLabelRow(unittest.TestCase):
         row._set_value(100)
         self.assertEqual(row.get_label(), "100 rpm")
 
+    def test_repeated_value_skips_relabel(self):
+        row = self.LabelRow(title="Speed", value="0")
+        row._set_value(100)
+        row._label.set_label("stale")
+        row._set_value(100)
+        self.assertEqual(row.get_label(), "stale")
+        row._set_value(100.0)
+        self.assertEqual(row.get_label(), "100.0")
+
+    def test_value_rerenders_after_set_label(self):
+        row = self.LabelRow(title="Speed", value="0")
+        queued = []
+        with patch("foxblat.widgets.label_row.GLib.idle_add",
+                   side_effect=lambda fn, *args: queued.append((fn, args))):
+            row.set_label("Disconnected")
+        # A value update that was queued earlier runs before the label
+        row._set_value(100)
+        for fn, args in queued:
+            fn(*args)
+        self.assertEqual(row.get_label(), "Disconnected")
+
+        row._set_value(100)
+        self.assertEqual(row.get_label(), "100")
+
+    def test_suffix_change_rerenders(self):
+        row = self.LabelRow(title="Speed", value="0")
+        row._set_value(100)
+        row.set_suffix(" rpm")
+        row._set_value(100)
+        self.assertEqual(row.get_label(), "100 rpm")
+
 
 @requires_gtk
 class TestFoxblatToggleButtonRow(unittest.TestCase):
@@ -453,6 +527,12 @@ class TestFoxblatLevelRow(unittest.TestCase):
         row.set_bar_max(200)
         self.assertEqual(row._max_value, 200)
 
+    def test_get_fraction_after_set_bar_max(self):
+        row = self.LevelRow(title="Level", max_value=100)
+        row.set_bar_max(200)
+        row._set_value(50)
+        self.assertAlmostEqual(row.get_fraction(), 0.25)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)